@@ -82,7 +82,9 @@ with st.sidebar:
             "🏠 Home",
             "📈 Sentiment Analysis",
             "📊 Dataset Explorer",
+            "📉 Sentiment Dashboard",
             "⚙️ Training Info",
+            "🔥 Profiles",
         ],
         label_visibility="collapsed"
     )
@@ -112,9 +114,15 @@ elif page == "📈 Sentiment Analysis":
 elif page == "📊 Dataset Explorer":
     from pages.Dataset_Explorer import show  # optional page
     show()
+elif page == "📉 Sentiment Dashboard":
+    from pages.Sentiment_Dashboard import show
+    show()
 elif page == "⚙️ Training Info":
     from pages.Training_Info import show
     show()
+elif page == "🔥 Profiles":
+    from pages.Profiles import show
+    show()
 
 # ======================================================
 # 🦶 PREMIUM FOOTER – RESPONSIVE 2-COLUMN
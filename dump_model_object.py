@@ -5,17 +5,23 @@
 
 import os
 import re
+import copy
+import time
 import joblib
 import json
+import argparse
 import numpy as np
 import pandas as pd
 
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.model_selection import GridSearchCV, train_test_split
+from sklearn.model_selection import GridSearchCV, StratifiedKFold, train_test_split
 from sklearn.linear_model import LogisticRegression
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import LabelEncoder
 from sklearn.metrics import accuracy_score, precision_recall_fscore_support
+from joblib import Parallel, delayed
+
+from models.profiling import profiled
 
 import nltk
 from nltk.corpus import stopwords
@@ -111,6 +117,7 @@ def load_dataset():
 # ==========================================
 # 🚀 TRAIN & DUMP MODEL
 # ==========================================
+@profiled("train_and_dump")
 def train_and_dump():
 
     # Load dataset
@@ -176,5 +183,109 @@ def train_and_dump():
     print(f"{INFO}🌟 Training Completed Successfully!{END}")
 
 
+# ==========================================
+# 🧩 SHARDED MULTI-CORE TRAINING (parameter averaging)
+# ==========================================
+def average_models(models):
+    """Average coef_/intercept_ of shard models into one LogisticRegression."""
+    merged = copy.deepcopy(models[0])
+    merged.coef_ = np.mean([m.coef_ for m in models], axis=0)
+    merged.intercept_ = np.mean([m.intercept_ for m in models], axis=0)
+    return merged
+
+
+def train_sharded(n_shards=None, C=2, merge="average", merge_iter=20):
+    """Fit one LogisticRegression per shard in parallel processes and merge them.
+
+    All shards share the same fixed TF-IDF vocabulary (fitted once on the
+    training split). `merge="refit"` adds a short warm-started pass over the
+    full training set starting from the averaged parameters.
+    """
+    n_shards = n_shards or os.cpu_count()
+
+    texts, labels = load_dataset()
+
+    print(f"{INFO}🧹 Cleaning dataset…{END}")
+    texts_cleaned = [clean_text(t) for t in texts]
+
+    label_encoder = LabelEncoder()
+    y = label_encoder.fit_transform(labels)
+
+    X_train_txt, X_test_txt, y_train, y_test = train_test_split(
+        texts_cleaned, y, test_size=0.2, random_state=42
+    )
+
+    print(f"{INFO}🔤 Fitting shared vocabulary…{END}")
+    vectorizer = TfidfVectorizer(ngram_range=(1, 2))
+    X_train = vectorizer.fit_transform(X_train_txt)
+    X_test = vectorizer.transform(X_test_txt)
+
+    # Stratified shards → every shard sees every class, so coef_ shapes match
+    _, counts = np.unique(y_train, return_counts=True)
+    n_shards = max(1, min(n_shards, int(counts.min())))
+    if n_shards > 1:
+        splitter = StratifiedKFold(n_splits=n_shards, shuffle=True, random_state=42)
+        shards = [idx for _, idx in splitter.split(X_train, y_train)]
+    else:
+        shards = [np.arange(X_train.shape[0])]
+
+    # ---------- serial baseline ----------
+    print(f"{INFO}🐢 Serial fit (baseline)…{END}")
+    t0 = time.perf_counter()
+    serial = LogisticRegression(C=C, max_iter=1000, solver="saga").fit(X_train, y_train)
+    serial_time = time.perf_counter() - t0
+    serial_acc = accuracy_score(y_test, serial.predict(X_test))
+
+    # ---------- sharded fit ----------
+    print(f"{INFO}⚡ Fitting {len(shards)} shards in parallel…{END}")
+    t0 = time.perf_counter()
+    # dispatch the bound `fit` of a fresh estimator: workers only unpickle
+    # sklearn, not this module (which downloads NLTK data on import)
+    shard_models = Parallel(n_jobs=len(shards))(
+        delayed(LogisticRegression(C=C, max_iter=1000, solver="saga").fit)(X_train[idx], y_train[idx])
+        for idx in shards
+    )
+    merged = average_models(shard_models)
+
+    if merge == "refit":
+        merged.set_params(warm_start=True, max_iter=merge_iter)
+        merged.fit(X_train, y_train)
+        merged.set_params(warm_start=False, max_iter=1000)
+    sharded_time = time.perf_counter() - t0
+    sharded_acc = accuracy_score(y_test, merged.predict(X_test))
+
+    print(f"{OK}⏱️  Serial: {serial_time:.2f}s  |  Sharded ({merge}): {sharded_time:.2f}s  "
+          f"→ speedup x{serial_time / sharded_time:.2f}{END}")
+    print(f"{OK}🎯 Accuracy serial: {serial_acc:.3f}  |  sharded: {sharded_acc:.3f}  "
+          f"(Δ {sharded_acc - serial_acc:+.3f}){END}")
+
+    pipeline = Pipeline([("tfidf", vectorizer), ("clf", merged)])
+
+    os.makedirs("models", exist_ok=True)
+    joblib.dump(pipeline, "models/model_en.pkl")
+    joblib.dump(label_encoder, "models/label_encoder.pkl")
+
+    print(f"{OK}📦 Model saved → models/model_en.pkl{END}")
+    print(f"{OK}📦 Label encoder saved → models/label_encoder.pkl{END}")
+
+    return {
+        "shards": len(shards),
+        "serial_time": serial_time,
+        "sharded_time": sharded_time,
+        "speedup": serial_time / sharded_time,
+        "serial_accuracy": serial_acc,
+        "sharded_accuracy": sharded_acc,
+    }
+
+
 if __name__ == "__main__":
-    train_and_dump()
+    parser = argparse.ArgumentParser(description="Train the English sentiment model")
+    parser.add_argument("--sharded", action="store_true", help="multi-core sharded training")
+    parser.add_argument("--shards", type=int, default=None, help="default: number of CPU cores")
+    parser.add_argument("--merge", choices=["average", "refit"], default="average")
+    args = parser.parse_args()
+
+    if args.sharded:
+        train_sharded(args.shards, merge=args.merge)
+    else:
+        train_and_dump()
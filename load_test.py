@@ -0,0 +1,262 @@
+# ======================================================
+# 🔥 LOAD TEST HARNESS – latency / throughput reports
+#
+#   python load_test.py --target inproc --clients 10 100 1000
+#   python load_test.py --target http --url http://127.0.0.1:8000/predict --mode open --rate 500
+#   python load_test.py --corpus data/reviews.csv --compare loadtest_results/<old>.json
+# ======================================================
+
+import os
+import csv
+import json
+import time
+import random
+import argparse
+import threading
+import urllib.request
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+RESULTS_DIR = "loadtest_results"
+
+# ================================
+# 🎨 Terminal Colors
+# ================================
+OK = "\033[92m"
+INFO = "\033[94m"
+WARN = "\033[93m"
+END = "\033[0m"
+
+
+# ======================================================
+# 📚 CORPUS
+# ======================================================
+VI_SAMPLES = [
+    "Sản phẩm rất tốt, giao hàng nhanh", "Hàng tệ quá, thất vọng", "Tạm được, không có gì đặc biệt",
+    "Chất lượng tuyệt vời, rất hài lòng", "Đóng gói kém, sản phẩm bị lỗi", "ăn ngon",
+]
+EN_SAMPLES = [
+    "This product is very good", "Worst purchase ever, I want a refund", "It is okay, average quality",
+    "Excellent quality and fast delivery", "The item arrived broken, bad seller", "Not good, not bad",
+]
+
+
+def synthetic_corpus(n=5000, vi_ratio=0.5, seed=42):
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        pool = VI_SAMPLES if rng.random() < vi_ratio else EN_SAMPLES
+        # vary length so long texts show up in the tail latencies
+        out.append(" ".join(rng.choice(pool) for _ in range(rng.randint(1, 4))))
+    return out
+
+
+def load_corpus(path, text_col="text"):
+    if path.endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            return [row[text_col] for row in csv.DictReader(f) if row.get(text_col)]
+    if path.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line).get(text_col, "") for line in f if line.strip()]
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+# ======================================================
+# 🎯 TARGETS
+# ======================================================
+def inproc_target():
+    from models import load_english_model
+    from models.batch_scoring import score_texts
+
+    model, vectorizer = load_english_model()
+
+    def call(texts):
+        score_texts(texts, model, vectorizer)
+
+    return call
+
+
+def http_target(url, timeout=30):
+    def call(texts):
+        req = urllib.request.Request(
+            url, data=json.dumps({"texts": texts}).encode("utf-8"),
+            headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            resp.read()
+
+    return call
+
+
+# ======================================================
+# ⚙️ CPU accounting
+# ======================================================
+def cpu_seconds(pids=()):
+    """CPU time (user+sys) of this process plus any extra pids (e.g. server workers)."""
+    t = os.times()
+    total = t.user + t.system
+    tick = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            total += (int(fields[11]) + int(fields[12])) / tick
+        except (OSError, IndexError):
+            pass
+    return total
+
+
+# ======================================================
+# 🏃 RUNNERS
+# ======================================================
+def run_closed(call, corpus, clients, duration, batch):
+    """Each client sends its next request as soon as the previous one returns."""
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client(seed):
+        rng = random.Random(seed)
+        local, err = [], 0
+        while time.perf_counter() < deadline:
+            texts = [rng.choice(corpus) for _ in range(batch)]
+            t0 = time.perf_counter()
+            try:
+                call(texts)
+                local.append(time.perf_counter() - t0)
+            except Exception:
+                err += 1
+        with lock:
+            latencies.extend(local)
+            errors[0] += err
+
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        for i in range(clients):
+            pool.submit(client, i)
+
+    return latencies, errors[0]
+
+
+def run_open(call, corpus, clients, duration, batch, rate):
+    """Requests arrive as a Poisson process at `rate`/s regardless of how fast
+    the target answers; latency is measured from the scheduled arrival time so
+    queueing delay is not hidden (no coordinated omission)."""
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    rng = random.Random(0)
+
+    def request(scheduled, texts):
+        try:
+            call(texts)
+            with lock:
+                latencies.append(time.perf_counter() - scheduled)
+        except Exception:
+            with lock:
+                errors[0] += 1
+
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        start = time.perf_counter()
+        next_at = start
+        while next_at < start + duration:
+            now = time.perf_counter()
+            if next_at > now:
+                time.sleep(next_at - now)
+            texts = [rng.choice(corpus) for _ in range(batch)]
+            pool.submit(request, next_at, texts)
+            next_at += rng.expovariate(rate)
+
+    return latencies, errors[0]
+
+
+def run_level(call, corpus, clients, args, server_pids=()):
+    cpu0, t0 = cpu_seconds(server_pids), time.perf_counter()
+
+    if args.mode == "open":
+        latencies, errors = run_open(call, corpus, clients, args.duration, args.batch, args.rate)
+    else:
+        latencies, errors = run_closed(call, corpus, clients, args.duration, args.batch)
+
+    wall = time.perf_counter() - t0
+    cpu = cpu_seconds(server_pids) - cpu0
+    total = len(latencies) + errors
+    lat_ms = np.array(latencies) * 1000 if latencies else np.zeros(1)
+
+    return {
+        "clients": clients,
+        "requests": total,
+        "throughput_rps": len(latencies) / wall,
+        "reviews_per_sec": len(latencies) * args.batch / wall,
+        "p50_ms": float(np.percentile(lat_ms, 50)),
+        "p95_ms": float(np.percentile(lat_ms, 95)),
+        "p99_ms": float(np.percentile(lat_ms, 99)),
+        "max_ms": float(lat_ms.max()),
+        "error_rate": errors / total if total else 0.0,
+        "cpu_cores": cpu / wall,
+    }
+
+
+# ======================================================
+# 📊 REPORT
+# ======================================================
+COLUMNS = ["clients", "throughput_rps", "p50_ms", "p95_ms", "p99_ms", "error_rate", "cpu_cores"]
+
+
+def print_report(results, baseline=None):
+    base = {r["clients"]: r for r in (baseline or {}).get("results", [])}
+
+    print(f"\n{INFO}" + " ".join(f"{c:>14}" for c in COLUMNS) + END)
+    for r in results:
+        print(" ".join(f"{r[c]:>14.2f}" if isinstance(r[c], float) else f"{r[c]:>14}" for c in COLUMNS))
+        old = base.get(r["clients"])
+        if old:
+            deltas = [
+                f"{(r[c] - old[c]) / old[c]:>+13.1%} " if old[c] else f"{'-':>14}"
+                for c in COLUMNS[1:]
+            ]
+            print(f"{WARN}{'Δ vs baseline':>14} " + " ".join(deltas) + END)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentiment serving load test")
+    parser.add_argument("--target", choices=["inproc", "http"], default="inproc")
+    parser.add_argument("--url", default="http://127.0.0.1:8000/predict")
+    parser.add_argument("--mode", choices=["closed", "open"], default="closed")
+    parser.add_argument("--clients", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--rate", type=float, default=200.0, help="open-loop arrivals per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per concurrency level")
+    parser.add_argument("--batch", type=int, default=1, help="reviews per request")
+    parser.add_argument("--corpus", help="CSV/JSONL/TXT file; synthetic VN/EN mix if omitted")
+    parser.add_argument("--text-col", default="text")
+    parser.add_argument("--server-pids", type=int, nargs="*", default=[],
+                        help="include these processes in CPU accounting")
+    parser.add_argument("--compare", help="previous results JSON to diff against")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus, args.text_col) if args.corpus else synthetic_corpus()
+    call = inproc_target() if args.target == "inproc" else http_target(args.url)
+
+    print(f"{INFO}🔥 {args.target} • {args.mode}-loop • {len(corpus)} reviews in corpus{END}")
+
+    results = []
+    for clients in args.clients:
+        print(f"{INFO}➡️  {clients} clients for {args.duration:.0f}s…{END}")
+        results.append(run_level(call, corpus, clients, args, args.server_pids))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(results, baseline)
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    out = os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}-{args.target}-{args.mode}.json")
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump({"config": vars(args), "results": results}, f, indent=2)
+    print(f"\n{OK}📦 Results saved → {out}{END}")
+
+
+if __name__ == "__main__":
+    main()
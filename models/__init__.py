@@ -1 +1,3 @@
 from .sentiment_model import load_english_model, is_vietnamese, vietnamese_sentiment
+from .sentiment_cube import SentimentCube
+from .cascade import SentimentCascade, lexicon_sentiment
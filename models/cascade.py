@@ -0,0 +1,184 @@
+import os
+import re
+import json
+
+from .sentiment_model import has_vietnamese_diacritics, VI_POS, VI_NEG
+from .batch_scoring import score_texts, _describe_batch
+from .profiling import profiled
+
+# ==========================
+#  Lexicons
+# ==========================
+EN_POS = ["good", "great", "excellent", "amazing", "love", "perfect", "awesome", "satisfied",
+          "recommend", "fast", "best", "nice", "worth", "happy", "beautiful"]
+EN_NEG = ["bad", "terrible", "awful", "worst", "hate", "poor", "broken", "disappointed",
+          "disappointing", "waste", "refund", "slow", "horrible", "useless", "fake"]
+EN_NEGATORS = {"not", "no", "never", "isn't", "wasn't", "don't", "doesn't", "didn't", "hardly"}
+
+THRESHOLDS_PATH = "models/cascade_thresholds.json"
+# model only until calibrated: confidence never reaches 1.01
+DEFAULT_THRESHOLDS = {"Vietnamese": 1.01, "English": 1.01}
+THRESHOLD_GRID = [0.3, 0.4, 0.5, 0.6, 0.67, 0.75, 0.8, 0.9]
+
+
+def lexicon_sentiment(text: str):
+    """Return (label, confidence, language) from word lists alone.
+
+    confidence = |pos - neg| / (pos + neg + 1): 0 with no or mixed hits,
+    0.5 for a single hit, growing as one-sided hits accumulate.
+    Routed by Vietnamese diacritics: is_vietnamese() also claims English
+    text without its hint words, which would hide the English lexicon.
+    """
+    t = text.lower()
+
+    if has_vietnamese_diacritics(t):
+        lang = "Vietnamese"
+        pos = sum(w in t for w in VI_POS)
+        neg = sum(w in t for w in VI_NEG)
+    else:
+        lang = "English"
+        pos = neg = 0
+        tokens = re.findall(r"[a-z']+", t)
+        for i, tok in enumerate(tokens):
+            if tok in EN_POS or tok in EN_NEG:
+                positive = tok in EN_POS
+                if EN_NEGATORS & set(tokens[max(0, i - 2):i]):
+                    positive = not positive
+                if positive:
+                    pos += 1
+                else:
+                    neg += 1
+
+    confidence = abs(pos - neg) / (pos + neg + 1)
+    if pos > neg:
+        return "positive", confidence, lang
+    if neg > pos:
+        return "negative", confidence, lang
+    return "neutral", 0.0, lang
+
+
+def model_sentiment(texts, model, vectorizer):
+    """Non-lexicon answers, routed exactly like lexicon_sentiment: reviews
+    without diacritics go to TF-IDF + LR, the rest to vietnamese_sentiment."""
+    return score_texts(texts, model, vectorizer, is_vi=has_vietnamese_diacritics)
+
+
+# ==========================
+#  Cascade
+# ==========================
+class SentimentCascade:
+    def __init__(self, model, vectorizer, thresholds=None):
+        self.model = model
+        self.vectorizer = vectorizer
+        self.thresholds = dict(thresholds or load_thresholds())
+        self.counts = {"lexicon": 0, "model": 0}
+
+    @profiled("cascade_score", describe=lambda self, texts: _describe_batch(texts))
+    def score(self, texts):
+        """Score reviews → list of (sentiment, confidence, language, path)."""
+        results = [None] * len(texts)
+        fallback = []
+
+        for i, text in enumerate(texts):
+            label, conf, lang = lexicon_sentiment(text)
+            if conf >= self.thresholds.get(lang, 1.0):
+                results[i] = (label, conf, lang, "lexicon")
+            else:
+                fallback.append(i)
+
+        if fallback:
+            model_results = model_sentiment([texts[i] for i in fallback], self.model, self.vectorizer)
+            for i, (label, conf, lang) in zip(fallback, model_results):
+                results[i] = (label, conf, lang, "model")
+
+        self.counts["lexicon"] += len(texts) - len(fallback)
+        self.counts["model"] += len(fallback)
+        return results
+
+    def report(self, texts):
+        """Share of reviews answered per path and agreement with the full model.
+
+        Agreement is measured on English reviews only: Vietnamese has no
+        model, and vietnamese_sentiment uses the same word lists as the
+        lexicon, so comparing the two would agree by construction.
+        """
+        cascade = self.score(texts)
+        full = model_sentiment(texts, self.model, self.vectorizer)
+
+        n = len(texts)
+        lexicon = [i for i, r in enumerate(cascade) if r[3] == "lexicon"]
+        english = [i for i, r in enumerate(cascade) if r[2] == "English"]
+        english_lexicon = [i for i in lexicon if cascade[i][2] == "English"]
+        agree = sum(cascade[i][0] == full[i][0] for i in english)
+        agree_lexicon = sum(cascade[i][0] == full[i][0] for i in english_lexicon)
+
+        return {
+            "reviews": n,
+            "lexicon_fraction": len(lexicon) / n if n else 0.0,
+            "model_fraction": 1 - len(lexicon) / n if n else 0.0,
+            "english_reviews": len(english),
+            "agreement": agree / len(english) if english else None,
+            "lexicon_agreement": agree_lexicon / len(english_lexicon) if english_lexicon else None,
+            "vietnamese_baseline": "none (no Vietnamese model – agreement is English only)",
+            "thresholds": self.thresholds,
+        }
+
+
+# ==========================
+#  Calibration
+# ==========================
+def calibrate_thresholds(texts, model, vectorizer, target_agreement=0.95, path=THRESHOLDS_PATH):
+    """Pick the lowest English threshold whose lexicon answers agree with
+    TF-IDF + LR at least `target_agreement` of the time.
+
+    Vietnamese stays at 1.01: there is no Vietnamese model to measure the
+    lexicon against (vietnamese_sentiment shares its word lists).
+    """
+    lex = [lexicon_sentiment(t) for t in texts]
+    english = [i for i, r in enumerate(lex) if r[2] == "English"]
+    full = dict(zip(english, model_sentiment([texts[i] for i in english], model, vectorizer)))
+
+    # never trust the lexicon unless proven
+    thresholds = {"Vietnamese": 1.01, "English": 1.01}
+    for th in THRESHOLD_GRID:
+        accepted = [i for i in english if lex[i][1] >= th]
+        if not accepted:
+            break
+        agreement = sum(lex[i][0] == full[i][0] for i in accepted) / len(accepted)
+        if agreement >= target_agreement:
+            thresholds["English"] = th
+            break
+
+    if path:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(thresholds, f, indent=2)
+    return thresholds
+
+
+def load_thresholds(path=THRESHOLDS_PATH):
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    return DEFAULT_THRESHOLDS
+
+
+# ==========================
+#  CLI: python -m models.cascade data/reviews.csv [text_col]
+# ==========================
+if __name__ == "__main__":
+    import sys
+    import pandas as pd
+    from .sentiment_model import load_english_model
+
+    if len(sys.argv) < 2:
+        sys.exit("usage: python -m models.cascade <reviews.csv> [text_col]")
+
+    texts = pd.read_csv(sys.argv[1])[sys.argv[2] if len(sys.argv) > 2 else "text"].astype(str).tolist()
+    model, vectorizer = load_english_model()
+
+    thresholds = calibrate_thresholds(texts, model, vectorizer)
+    print(f"Calibrated thresholds → {THRESHOLDS_PATH}: {thresholds}")
+
+    for key, value in SentimentCascade(model, vectorizer, thresholds).report(texts).items():
+        print(f"{key:>18}: {value:.3f}" if isinstance(value, float) else f"{key:>18}: {value}")
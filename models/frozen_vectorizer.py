@@ -0,0 +1,76 @@
+import copy
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.preprocessing import normalize
+
+
+# ==========================
+#  Frozen TF-IDF vectorizer
+# ==========================
+# A fitted TfidfVectorizer keeps its vocabulary in `vocabulary_`, a dict of
+# str → int. Every lookup returns (and increfs) one of those int objects, so
+# forked workers write to the refcounts of the shared vocabulary and the
+# pages holding it get copied, one by one, as traffic touches more terms.
+#
+# FrozenVectorizer keeps the vocabulary as two numpy arrays instead
+# (sorted 64-bit term hashes + column ids) and looks tokens up with
+# np.searchsorted: no per-term Python objects survive, and lookups only
+# read the array buffers. Hashes come from the interpreter's str hash, so
+# build it in the process that forks the workers – don't pickle it.
+class FrozenVectorizer:
+    def __init__(self, vectorizer):
+        terms = list(vectorizer.vocabulary_)
+        hashes = np.fromiter((hash(t) for t in terms), dtype=np.int64, count=len(terms))
+        columns = np.fromiter((vectorizer.vocabulary_[t] for t in terms), dtype=np.int32, count=len(terms))
+
+        order = np.argsort(hashes)
+        self.hashes = hashes[order]
+        self.columns = columns[order]
+        if len(self.hashes) and (np.diff(self.hashes) == 0).any():
+            raise ValueError("Vocabulary hash collision – keep the plain vectorizer.")
+
+        self.n_features = len(terms)
+        self.idf = np.asarray(vectorizer.idf_, dtype=np.float64) if vectorizer.use_idf else None
+        self.binary = vectorizer.binary
+        self.sublinear_tf = vectorizer.sublinear_tf
+        self.norm = vectorizer.norm
+        self.dtype = vectorizer.dtype
+
+        # the analyzer is bound to the vectorizer → keep a copy without the dict
+        stripped = copy.copy(vectorizer)
+        for attr in ("vocabulary_", "stop_words_", "_tfidf"):
+            stripped.__dict__.pop(attr, None)
+        self.analyzer = stripped.build_analyzer()
+
+    def _columns(self, tokens):
+        if not tokens:
+            return np.empty(0, dtype=np.int32)
+        h = np.fromiter((hash(t) for t in tokens), dtype=np.int64, count=len(tokens))
+        pos = np.searchsorted(self.hashes, h).clip(max=len(self.hashes) - 1)
+        return self.columns[pos[self.hashes[pos] == h]]
+
+    def transform(self, raw_documents):
+        """Same matrix as TfidfVectorizer.transform (up to 64-bit hash collisions)."""
+        cols = [self._columns(self.analyzer(doc)) if self.n_features else np.empty(0, dtype=np.int32)
+                for doc in raw_documents]
+        indptr = np.zeros(len(cols) + 1, dtype=np.int64)
+        np.cumsum([len(c) for c in cols], out=indptr[1:])
+        indices = np.concatenate(cols) if cols else np.empty(0, dtype=np.int32)
+
+        X = csr_matrix(
+            (np.ones(len(indices), dtype=np.float64), indices, indptr),
+            shape=(len(cols), self.n_features),
+        )
+        X.sum_duplicates()
+
+        if self.binary:
+            X.data[:] = 1
+        if self.sublinear_tf:
+            np.log(X.data, X.data)
+            X.data += 1
+        if self.idf is not None:
+            X.data *= self.idf[X.indices]
+        if self.norm:
+            X = normalize(X, norm=self.norm, copy=False)
+        return X.astype(self.dtype, copy=False)
@@ -0,0 +1,404 @@
+import io
+import os
+import re
+import csv
+import json
+import mmap
+import shutil
+import hashlib
+import numpy as np
+import pandas as pd
+from collections import Counter, defaultdict, namedtuple
+
+# ==========================
+#  Tokenizer
+# ==========================
+# \w is unicode-aware, so Vietnamese syllables ("giao", "hàng") stay intact.
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+INDEX_DIR = "data/.index"
+FINGERPRINT_BYTES = 64 * 1024
+TOP_TERMS = 1000
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(str(text).lower())
+
+
+def index_terms(tokens):
+    """Unigrams plus adjacent bigrams ("giao hàng"), used for phrase lookups."""
+    terms = set(tokens)
+    terms.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+    return terms
+
+
+# ==========================
+#  Posting list compression (delta + varint)
+# ==========================
+def encode_varints(numbers):
+    out = bytearray()
+    for n in numbers:
+        while n >= 0x80:
+            out.append((n & 0x7F) | 0x80)
+            n >>= 7
+        out.append(n)
+    return bytes(out)
+
+
+def decode_postings(data):
+    postings = []
+    doc, n, shift = 0, 0, 0
+    for byte in data:
+        n |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        doc += n
+        postings.append(doc)
+        n, shift = 0, 0
+    return postings
+
+
+# an in-place edit past the fingerprinted prefix keeps the size but not the mtime
+FileState = namedtuple("FileState", "size inode mtime_ns fingerprint")
+
+
+def file_fingerprint(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        h.update(f.read(FINGERPRINT_BYTES))
+    return h.hexdigest()
+
+
+# ==========================
+#  On-disk layout
+# ==========================
+# One directory per (file, columns):
+#   terms.bin      sorted utf-8 terms, back to back
+#   postings.bin   delta/varint row ids, one run per term
+#   term_offsets / post_offsets / last_doc / counts / labels  (.npy)
+#   row_starts.npy byte offset of every CSV record → rows are read back by seek
+#   meta.json      rows, file state, header, labels, top terms
+# Blobs are mmap'd and arrays opened with mmap_mode="r", so opening an
+# index costs O(1) and a lookup is a binary search over the term table.
+def _map_blob(path):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _offsets(lengths):
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+# ==========================
+#  Inverted Index
+# ==========================
+class KeywordIndex:
+    def __init__(self, path, text_col, label_col=None):
+        self.path = str(path)
+        self.text_col = text_col
+        self.label_col = label_col
+        self.meta = None
+
+    @property
+    def index_path(self):
+        key = hashlib.sha1(
+            f"{os.path.abspath(self.path)}|{self.text_col}|{self.label_col}".encode("utf-8")
+        ).hexdigest()[:16]
+        return os.path.join(INDEX_DIR, f"{os.path.basename(self.path)}.{key}")
+
+    def file_state(self):
+        st = os.stat(self.path)
+        return FileState(st.st_size, st.st_ino, st.st_mtime_ns, file_fingerprint(self.path))
+
+    def stored_meta(self):
+        meta_path = os.path.join(self.index_path, "meta.json")
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def status(self, state=None):
+        """"missing", "stale" or "current" – cheap, nothing is loaded."""
+        meta = self.stored_meta()
+        if meta is None:
+            return "missing"
+        state = state or self.file_state()
+        return "current" if meta.get("file") == state._asdict() else "stale"
+
+    # ---------- open ----------
+    @classmethod
+    def load(cls, path, text_col, label_col=None):
+        """Map a built index; never (re)builds."""
+        index = cls(path, text_col, label_col)
+        index.meta = index.stored_meta()
+        if index.meta is None:
+            raise FileNotFoundError(f"No keyword index for {path} – build it first.")
+
+        d = index.index_path
+        index.terms = _map_blob(os.path.join(d, "terms.bin"))
+        index.postings = _map_blob(os.path.join(d, "postings.bin"))
+        for name in ("term_offsets", "post_offsets", "last_doc", "counts", "labels", "row_starts"):
+            setattr(index, name, np.load(os.path.join(d, f"{name}.npy"), mmap_mode="r"))
+        return index
+
+    @property
+    def rows(self):
+        return self.meta["rows"] if self.meta else 0
+
+    @property
+    def n_terms(self):
+        return len(self.term_offsets) - 1 if self.meta else 0
+
+    @property
+    def label_names(self):
+        return self.meta["label_names"] if self.meta else []
+
+    # ---------- build / update ----------
+    def _records(self, offset=0):
+        """Yield (start, end, fields) per CSV record from byte `offset` on.
+
+        Quoted fields may span lines; blank lines are skipped (as pandas
+        does); an unterminated quoted record at EOF is left for later.
+        """
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            buffer, quotes = b"", 0
+            for line in f:
+                buffer += line
+                quotes += line.count(b'"')
+                if quotes % 2:
+                    continue
+                if buffer.strip():
+                    text = buffer.decode("utf-8", errors="replace")
+                    yield offset, offset + len(buffer), next(csv.reader(io.StringIO(text)))
+                offset += len(buffer)
+                buffer, quotes = b"", 0
+
+    def refresh(self):
+        """Bring the index in line with the file on disk (explicit action).
+
+        Appended rows are merged into the existing index; any other change
+        rebuilds. Returns the number of newly indexed rows.
+        """
+        state = self.file_state()
+        meta = self.stored_meta()
+        if meta and meta.get("file") == state._asdict():
+            return 0
+
+        old_state = FileState(**meta["file"]) if meta and "file" in meta else None
+        appended = (
+            old_state is not None
+            and meta["ends_with_newline"]
+            and state.inode == old_state.inode
+            and state.size > old_state.size
+            and old_state.size >= FINGERPRINT_BYTES
+            and state.fingerprint == old_state.fingerprint
+        )
+        old = KeywordIndex.load(self.path, self.text_col, self.label_col) if appended else None
+        start = old.rows if old else 0
+        label_names = list(old.label_names) if old else []
+
+        if old:
+            header, offset = meta["header"], meta["end_offset"]
+        else:
+            _, offset, header = next(self._records(0), (0, 0, []))
+        text_idx = header.index(self.text_col)
+        label_idx = header.index(self.label_col) if self.label_col else None
+
+        # index the new rows in memory
+        pending = defaultdict(list)
+        term_counts = defaultdict(Counter)   # label id → unigram counts
+        labels, row_starts = [], []
+        doc = start
+        end_offset = offset
+        for row_start, end_offset, fields in self._records(offset):
+            text = fields[text_idx] if text_idx < len(fields) else ""
+            tokens = tokenize(text)
+            for term in index_terms(tokens):
+                pending[term.encode("utf-8")].append(doc)
+
+            label_id = -1
+            if self.label_col:
+                label = fields[label_idx] if label_idx < len(fields) else ""
+                if label not in label_names:
+                    label_names.append(label)
+                label_id = label_names.index(label)
+                term_counts[label_id].update(tokens)
+            labels.append(label_id)
+            row_starts.append(row_start)
+            doc += 1
+
+        with open(self.path, "rb") as f:
+            f.seek(max(end_offset - 1, 0))
+            ends_with_newline = f.read(1) == b"\n"
+
+        # merge with the existing term table (sorted by utf-8 bytes)
+        old_terms = old.all_terms() if old else []
+        terms = sorted(set(old_terms).union(pending))
+        position = {t: i for i, t in enumerate(terms)}
+
+        counts = np.zeros((len(terms), len(label_names)), dtype=np.int32)
+        last_doc = np.zeros(len(terms), dtype=np.int64)
+        if old:
+            old_pos = np.fromiter((position[t] for t in old_terms), dtype=np.int64, count=len(old_terms))
+            counts[old_pos, :old.counts.shape[1]] = old.counts
+            last_doc[old_pos] = old.last_doc
+            old_index = dict(zip(old_terms, range(len(old_terms))))
+        for label_id, counter in term_counts.items():
+            for token, c in counter.items():
+                counts[position[token.encode("utf-8")], label_id] += c
+
+        tmp = self.index_path + ".tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+
+        lengths = np.zeros(len(terms), dtype=np.int64)
+        with open(os.path.join(tmp, "postings.bin"), "wb") as out:
+            for i, term in enumerate(terms):
+                run = old.postings_bytes(old_index[term]) if old and term in old_index else b""
+                docs = pending.get(term)
+                if docs:
+                    prev = int(last_doc[i]) if run else 0
+                    run += encode_varints([docs[0] - prev] + [b - a for a, b in zip(docs, docs[1:])])
+                    last_doc[i] = docs[-1]
+                out.write(run)
+                lengths[i] = len(run)
+
+        with open(os.path.join(tmp, "terms.bin"), "wb") as out:
+            out.write(b"".join(terms))
+
+        old_labels = np.asarray(old.labels) if old else np.zeros(0, dtype=np.int32)
+        old_starts = np.asarray(old.row_starts) if old else np.zeros(0, dtype=np.int64)
+        arrays = {
+            "term_offsets": _offsets([len(t) for t in terms]),
+            "post_offsets": _offsets(lengths),
+            "last_doc": last_doc,
+            "counts": counts,
+            "labels": np.concatenate([old_labels, np.asarray(labels, dtype=np.int32)]),
+            "row_starts": np.concatenate([old_starts, np.asarray(row_starts, dtype=np.int64)]),
+        }
+        for name, array in arrays.items():
+            np.save(os.path.join(tmp, f"{name}.npy"), array)
+
+        top = {}
+        for label_id, name in enumerate(label_names):
+            column = counts[:, label_id]
+            k = min(TOP_TERMS, len(column))
+            best = np.argpartition(-column, k - 1)[:k] if k else []
+            best = sorted(best, key=lambda i: -column[i])
+            top[name] = [(terms[i].decode("utf-8"), int(column[i])) for i in best if column[i]]
+
+        meta = {
+            "rows": doc, "file": state._asdict(), "header": header,
+            "end_offset": end_offset, "ends_with_newline": ends_with_newline,
+            "label_names": label_names, "top_terms": top,
+        }
+        with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+        # swap the finished directory in; open mmaps keep reading the old files
+        stale = self.index_path + ".old"
+        shutil.rmtree(stale, ignore_errors=True)
+        if os.path.exists(self.index_path):
+            os.replace(self.index_path, stale)
+        os.replace(tmp, self.index_path)
+        shutil.rmtree(stale, ignore_errors=True)
+        return doc - start
+
+    # ---------- term table ----------
+    def term_at(self, i):
+        return bytes(self.terms[self.term_offsets[i]:self.term_offsets[i + 1]])
+
+    def all_terms(self):
+        offsets = self.term_offsets.tolist()
+        return [bytes(self.terms[a:b]) for a, b in zip(offsets, offsets[1:])]
+
+    def postings_bytes(self, i):
+        return bytes(self.postings[self.post_offsets[i]:self.post_offsets[i + 1]])
+
+    def find(self, term):
+        """Binary search for `term` → term id, or -1."""
+        key = term.encode("utf-8")
+        lo, hi = 0, self.n_terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.term_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < self.n_terms and self.term_at(lo) == key else -1
+
+    # ---------- queries ----------
+    def _docs(self, term):
+        i = self.find(term)
+        return set(decode_postings(self.postings_bytes(i))) if i >= 0 else set()
+
+    def lookup(self, term):
+        tokens = tokenize(term)
+        if not tokens:
+            return set()
+        if len(tokens) == 1:
+            return self._docs(tokens[0])
+
+        # phrase → intersect bigram postings (exact for two-word phrases)
+        result = None
+        for a, b in zip(tokens, tokens[1:]):
+            docs = self._docs(f"{a} {b}")
+            result = docs if result is None else result & docs
+            if not result:
+                break
+        return result
+
+    def search(self, query, mode="any"):
+        """`query`: bare words and/or "quoted phrases"; mode "any" (OR) or "all" (AND)."""
+        phrases = re.findall(r'"([^"]+)"', query)
+        words = re.sub(r'"[^"]+"', " ", query).split()
+        terms = phrases + [w for w in words if w.upper() not in ("OR", "AND")]
+
+        result = None
+        for term in terms:
+            docs = self.lookup(term)
+            if result is None:
+                result = docs
+            elif mode == "all":
+                result &= docs
+            else:
+                result |= docs
+        return sorted(result or [])
+
+    def label_counts(self, rows):
+        if not self.label_col or not rows:
+            return Counter()
+        ids = np.bincount(self.labels[np.asarray(rows)], minlength=len(self.label_names))
+        return Counter({self.label_names[i]: int(c) for i, c in enumerate(ids) if c})
+
+    def top_terms(self, n=10, stop_words=()):
+        # precomputed at build time (TOP_TERMS per label)
+        return {
+            label: [(t, c) for t, c in terms if t not in stop_words][:n]
+            for label, terms in self.meta["top_terms"].items()
+        }
+
+    def fetch_rows(self, rows, limit=500):
+        """Read only the matching records back, seeking to their byte offsets."""
+        wanted = sorted(set(rows[:limit]))
+        if not wanted:
+            return pd.DataFrame()
+
+        records = []
+        with open(self.path, "rb") as f:
+            for r in wanted:
+                start = int(self.row_starts[r])
+                end = int(self.row_starts[r + 1]) if r + 1 < self.rows else self.meta["end_offset"]
+                f.seek(start)
+                records.append(f.read(end - start).rstrip(b"\r\n") + b"\n")
+
+        header = io.StringIO()
+        csv.writer(header).writerow(self.meta["header"])
+        df = pd.read_csv(io.BytesIO(header.getvalue().encode("utf-8") + b"".join(records)))
+        df.index = wanted
+        return df
@@ -0,0 +1,126 @@
+import os
+import time
+import hashlib
+import joblib
+import numpy as np
+
+from joblib import Parallel, delayed
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.svm import SVC
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.model_selection import StratifiedKFold, KFold
+from sklearn.metrics import accuracy_score, f1_score
+
+CACHE_DIR = "data/.cache/kfold"
+
+ALGORITHMS = {
+    "Logistic Regression": lambda: LogisticRegression(max_iter=200),
+    "Support Vector Machine (SVM)": lambda: SVC(probability=True),
+    "Naive Bayes": lambda: MultinomialNB(),
+}
+
+
+def make_model(algo):
+    return ALGORITHMS[algo]()
+
+
+def dataset_hash(texts, labels):
+    h = hashlib.sha1()
+    for t, y in zip(texts, labels):
+        h.update(f"{t}\x1f{y}\x1e".encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def _cache_path(kind, *parts):
+    key = hashlib.sha1("|".join(map(str, parts)).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"{kind}_{key}.pkl")
+
+
+# ==========================
+#  Fold features (vectorized once, reused by every algorithm)
+# ==========================
+def fold_features(texts, labels, k=5, seed=42, data_hash=None):
+    texts = np.asarray(texts, dtype=object)
+    labels = np.asarray(labels)
+    data_hash = data_hash or dataset_hash(texts, labels)
+
+    path = _cache_path("folds", data_hash, k, seed)
+    if os.path.exists(path):
+        return joblib.load(path)
+
+    # stratify when every class has at least k samples
+    _, counts = np.unique(labels, return_counts=True)
+    splitter = (
+        StratifiedKFold(n_splits=k, shuffle=True, random_state=seed)
+        if counts.min() >= k
+        else KFold(n_splits=k, shuffle=True, random_state=seed)
+    )
+
+    folds = []
+    for train_idx, test_idx in splitter.split(texts, labels):
+        vectorizer = TfidfVectorizer()
+        X_train = vectorizer.fit_transform(texts[train_idx])
+        X_test = vectorizer.transform(texts[test_idx])
+        folds.append((X_train, labels[train_idx], X_test, labels[test_idx]))
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    joblib.dump(folds, path)
+    return folds
+
+
+def _fit_fold(algo, X_train, y_train, X_test, y_test, classes):
+    model = make_model(algo)
+
+    t0 = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    y_pred = model.predict(X_test)
+    predict_time = time.perf_counter() - t0
+
+    return {
+        "accuracy": accuracy_score(y_test, y_pred),
+        "f1": f1_score(y_test, y_pred, labels=classes, average=None, zero_division=0),
+        "fit_time": fit_time,
+        "throughput": len(y_test) / predict_time if predict_time else float("inf"),
+    }
+
+
+# ==========================
+#  K-fold evaluation
+# ==========================
+def evaluate_kfold(texts, labels, algo, k=5, seed=42, n_jobs=-1):
+    """Cross-validate `algo`, one process per fold.
+
+    Results are cached on disk per (dataset hash, algorithm, k, seed).
+    """
+    data_hash = dataset_hash(texts, labels)
+    path = _cache_path("result", data_hash, algo, k, seed)
+    if os.path.exists(path):
+        return joblib.load(path)
+
+    folds = fold_features(texts, labels, k=k, seed=seed, data_hash=data_hash)
+    classes = sorted(set(labels))
+
+    scores = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_fold)(algo, *fold, classes) for fold in folds
+    )
+
+    acc = np.array([s["accuracy"] for s in scores])
+    f1 = np.vstack([s["f1"] for s in scores])
+    result = {
+        "algorithm": algo,
+        "k": k,
+        "dataset_hash": data_hash,
+        "accuracy_mean": float(acc.mean()),
+        "accuracy_std": float(acc.std()),
+        "fold_accuracy": acc.tolist(),
+        "f1_per_class": {str(c): float(v) for c, v in zip(classes, f1.mean(axis=0))},
+        "fit_time_mean": float(np.mean([s["fit_time"] for s in scores])),
+        "throughput_mean": float(np.mean([s["throughput"] for s in scores])),
+    }
+
+    joblib.dump(result, path)
+    return result
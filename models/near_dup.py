@@ -0,0 +1,96 @@
+import re
+import zlib
+import numpy as np
+
+# ==========================
+#  MinHash signatures
+# ==========================
+MERSENNE_PRIME = (1 << 31) - 1
+SHINGLE_SIZE = 5
+NUM_PERM = 64
+
+
+def normalize(text: str) -> str:
+    text = str(text).lower()
+    text = re.sub(r"\s+", " ", text)
+    return text.strip()
+
+
+def shingles(text: str, k: int = SHINGLE_SIZE):
+    t = normalize(text)
+    if len(t) <= k:
+        return {t}
+    return {t[i:i + k] for i in range(len(t) - k + 1)}
+
+
+class MinHasher:
+    def __init__(self, num_perm=NUM_PERM, seed=1):
+        rng = np.random.RandomState(seed)
+        # a * h fits in uint64 since a, h < 2**31
+        self.a = rng.randint(1, MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+        self.b = rng.randint(0, MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+        self.num_perm = num_perm
+
+    def signature(self, text: str):
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) & MERSENNE_PRIME for s in shingles(text)),
+            dtype=np.uint64,
+        )
+        perm = (hashes[:, None] * self.a + self.b) % MERSENNE_PRIME
+        return perm.min(axis=0)
+
+
+def lsh_params(threshold, num_perm=NUM_PERM):
+    """Pick (bands, rows) whose S-curve midpoint (1/b)^(1/r) is closest to threshold."""
+    best = None
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        err = abs((1 / bands) ** (1 / rows) - threshold)
+        if best is None or err < best[0]:
+            best = (err, bands, rows)
+    return best[1], best[2]
+
+
+# ==========================
+#  Near-duplicate grouping
+# ==========================
+def group_near_duplicates(texts, threshold=0.8, num_perm=NUM_PERM):
+    """Return (representatives, owner) where owner[i] is the index of the
+    representative text that item i should take its prediction from.
+
+    Candidates come from LSH band collisions and are confirmed by the
+    estimated Jaccard similarity of their MinHash signatures.
+    """
+    hasher = MinHasher(num_perm)
+    bands, rows = lsh_params(threshold, num_perm)
+
+    buckets = [{} for _ in range(bands)]
+    signatures = {}  # representative index → signature
+    owner = []
+    representatives = []
+
+    for i, text in enumerate(texts):
+        sig = hasher.signature(text)
+
+        match = None
+        keys = [sig[b * rows:(b + 1) * rows].tobytes() for b in range(bands)]
+        for b, key in enumerate(keys):
+            rep = buckets[b].get(key)
+            if rep is None:
+                continue
+            if np.mean(signatures[rep] == sig) >= threshold:
+                match = rep
+                break
+
+        if match is None:
+            match = i
+            representatives.append(i)
+            signatures[i] = sig
+            for b, key in enumerate(keys):
+                buckets[b].setdefault(key, i)
+
+        owner.append(match)
+
+    return representatives, owner
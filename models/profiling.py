@@ -0,0 +1,295 @@
+import os
+import sys
+import json
+import time
+import logging
+import uuid
+import zlib
+import random
+import pstats
+import hashlib
+import cProfile
+import threading
+import functools
+from html import escape
+from datetime import datetime
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+# ==========================
+#  Settings (opt-in via environment)
+# ==========================
+#   SENTIMENT_PROFILE=1                 enable the hooks
+#   SENTIMENT_PROFILE_THRESHOLD_MS=250  save any call slower than this
+#   SENTIMENT_PROFILE_SAMPLE=0.05       fraction of calls run under cProfile
+PROFILE_DIR = "data/.profiles"
+SAMPLE_INTERVAL = 0.005
+
+settings = {
+    "enabled": os.environ.get("SENTIMENT_PROFILE", "0") not in ("", "0", "false"),
+    "threshold_ms": float(os.environ.get("SENTIMENT_PROFILE_THRESHOLD_MS", 250)),
+    "sample_rate": float(os.environ.get("SENTIMENT_PROFILE_SAMPLE", 0.05)),
+    "dir": os.environ.get("SENTIMENT_PROFILE_DIR", PROFILE_DIR),
+}
+
+_local = threading.local()
+# only one cProfile may be active per interpreter
+_cprofile_lock = threading.Lock()
+
+
+def enable(threshold_ms=None, sample_rate=None):
+    settings["enabled"] = True
+    if threshold_ms is not None:
+        settings["threshold_ms"] = threshold_ms
+    if sample_rate is not None:
+        settings["sample_rate"] = sample_rate
+
+
+def disable():
+    settings["enabled"] = False
+
+
+# ==========================
+#  Stack sampler (one background thread for all active calls)
+# ==========================
+class StackSampler:
+    """Samples the stacks of registered threads every SAMPLE_INTERVAL seconds.
+
+    Cheap enough to run on every profiled call, so slow calls always come
+    with collapsed stacks even when they were not picked for cProfile.
+    """
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.active = {}      # thread id → Counter of collapsed stacks
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            with self.lock:
+                if not self.active:
+                    self.thread = None
+                    return
+                frames = sys._current_frames()
+                for tid, stacks in self.active.items():
+                    frame = frames.get(tid)
+                    if frame is not None:
+                        stacks[collapse(frame)] += 1
+
+    def start(self, tid):
+        stacks = Counter()
+        with self.lock:
+            self.active[tid] = stacks
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, daemon=True, name="stack-sampler")
+                self.thread.start()
+        return stacks
+
+    def stop(self, tid):
+        with self.lock:
+            return self.active.pop(tid, Counter())
+
+
+_sampler = StackSampler()
+
+
+def collapse(frame):
+    parts = []
+    while frame is not None:
+        code = frame.f_code
+        parts.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(parts))
+
+
+# ==========================
+#  Capture storage
+# ==========================
+def _save_capture(name, elapsed_ms, meta, stacks, profiler):
+    capture_id = f"{datetime.now():%Y%m%d-%H%M%S}-{name}-{uuid.uuid4().hex[:6]}"
+    path = os.path.join(settings["dir"], capture_id)
+    os.makedirs(path, exist_ok=True)
+
+    with open(os.path.join(path, "stacks.collapsed"), "w", encoding="utf-8") as f:
+        for stack, count in stacks.most_common():
+            f.write(f"{stack} {count}\n")
+
+    if profiler is not None:
+        profiler.dump_stats(os.path.join(path, "profile.pstats"))
+
+    with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({
+            "id": capture_id,
+            "name": name,
+            "elapsed_ms": round(elapsed_ms, 2),
+            "threshold_ms": settings["threshold_ms"],
+            "full_profile": profiler is not None,
+            "samples": sum(stacks.values()),
+            "captured_at": datetime.now().isoformat(timespec="seconds"),
+            **meta,
+        }, f, ensure_ascii=False, indent=2)
+
+    return path
+
+
+def annotate(**meta):
+    """Attach metadata (e.g. text_metadata(review)) to the current profiled call."""
+    if getattr(_local, "busy", False):
+        _local.meta.update(meta)
+
+
+def text_metadata(text):
+    """Describe a triggering input without storing all of it."""
+    text = str(text)
+    return {
+        "input_chars": len(text),
+        "input_words": len(text.split()),
+        "input_sha1": hashlib.sha1(text.encode("utf-8")).hexdigest()[:12],
+        "input_preview": text[:120],
+    }
+
+
+# ==========================
+#  Hook
+# ==========================
+def profiled(name, describe=None):
+    """Decorator: time every call; save stacks (and pstats when sampled) for
+    calls slower than the threshold. `describe(*args, **kwargs)` → metadata.
+
+    A no-op apart from one dict lookup while profiling is disabled. Nested
+    profiled calls are covered by the outermost one.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not settings["enabled"] or getattr(_local, "busy", False):
+                return func(*args, **kwargs)
+
+            _local.busy = True
+            _local.meta = {}
+            tid = threading.get_ident()
+            profiler = None
+            if random.random() < settings["sample_rate"] and _cprofile_lock.acquire(blocking=False):
+                profiler = cProfile.Profile()
+            stacks = _sampler.start(tid)
+            start = time.perf_counter()
+            try:
+                if profiler is not None:
+                    return profiler.runcall(func, *args, **kwargs)
+                return func(*args, **kwargs)
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                _sampler.stop(tid)
+                if profiler is not None:
+                    _cprofile_lock.release()
+                _local.busy = False
+
+                if elapsed_ms >= settings["threshold_ms"]:
+                    meta = dict(_local.meta)
+                    if describe is not None:
+                        try:
+                            meta.update(describe(*args, **kwargs))
+                        except Exception:
+                            pass
+                    # a full disk must not replace the call's own result / exception
+                    try:
+                        _save_capture(name, elapsed_ms, meta, stacks, profiler)
+                    except Exception:
+                        logger.exception("Could not save profile capture for %s", name)
+
+        return wrapper
+
+    return decorator
+
+
+# ==========================
+#  Browsing captures
+# ==========================
+def list_captures(directory=None):
+    directory = directory or settings["dir"]
+    if not os.path.isdir(directory):
+        return []
+
+    captures = []
+    for entry in sorted(os.listdir(directory), reverse=True):
+        meta_path = os.path.join(directory, entry, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding="utf-8") as f:
+                captures.append({**json.load(f), "path": os.path.join(directory, entry)})
+    return captures
+
+
+def read_collapsed(path):
+    stacks = Counter()
+    with open(os.path.join(path, "stacks.collapsed"), encoding="utf-8") as f:
+        for line in f:
+            stack, _, count = line.rstrip("\n").rpartition(" ")
+            if stack:
+                stacks[stack] += int(count)
+    return stacks
+
+
+def top_functions(path, n=25, sort="cumulative"):
+    """Rows (function, calls, tottime, cumtime) from a capture's pstats file."""
+    stats_path = os.path.join(path, "profile.pstats")
+    if not os.path.exists(stats_path):
+        return []
+
+    stats = pstats.Stats(stats_path)
+    rows = []
+    for (filename, line, func), (cc, nc, tt, ct, _) in stats.stats.items():
+        rows.append({
+            "function": f"{func} ({os.path.basename(filename)}:{line})",
+            "calls": nc,
+            "tottime_ms": tt * 1000,
+            "cumtime_ms": ct * 1000,
+        })
+    key = "cumtime_ms" if sort == "cumulative" else "tottime_ms"
+    return sorted(rows, key=lambda r: r[key], reverse=True)[:n]
+
+
+def flamegraph_svg(stacks, width=1100, row_height=18):
+    """Render collapsed stacks as a self-contained SVG flame graph."""
+    tree = {"children": {}, "count": 0}
+    for stack, count in stacks.items():
+        node = tree
+        node["count"] += count
+        for frame in stack.split(";"):
+            node = node["children"].setdefault(frame, {"children": {}, "count": 0})
+            node["count"] += count
+
+    total = tree["count"] or 1
+    rects = []
+
+    def walk(node, x, depth):
+        for frame, child in sorted(node["children"].items()):
+            w = child["count"] / total * width
+            if w >= 0.5:
+                rects.append((frame, x, depth, w, child["count"]))
+                walk(child, x, depth + 1)
+            x += w
+
+    walk(tree, 0.0, 0)
+    depth = max((r[2] for r in rects), default=0) + 1
+    height = depth * row_height
+
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+             f'style="font-family:monospace;font-size:11px">']
+    for frame, x, d, w, count in rects:
+        y = height - (d + 1) * row_height
+        hue = 10 + (zlib.crc32(frame.encode("utf-8")) % 40)
+        label = escape(frame)
+        parts.append(
+            f'<g><title>{label} — {count} samples ({count / total:.1%})</title>'
+            f'<rect x="{x:.1f}" y="{y}" width="{w:.1f}" height="{row_height - 1}" '
+            f'fill="hsl({hue},85%,60%)" rx="2"/>'
+        )
+        if w > 40:
+            max_chars = int(w / 7)
+            parts.append(f'<text x="{x + 3:.1f}" y="{y + 13}">{escape(frame[:max_chars])}</text>')
+        parts.append("</g>")
+    parts.append("</svg>")
+    return "".join(parts)
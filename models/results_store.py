@@ -0,0 +1,260 @@
+import os
+import json
+import uuid
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .sentiment_cube import SentimentCube, CUBE_PATH, cube_lock
+
+# ==========================
+#  Layout
+# ==========================
+# data/results/date=2026-10-19/language=English/part-<uuid>.parquet
+RESULTS_DIR = "data/results"
+STAGING_DIR = ".staging"   # dot-prefixed → skipped by dataset discovery
+
+SCHEMA = pa.schema([
+    ("review", pa.string()),
+    ("sentiment", pa.dictionary(pa.int8(), pa.string())),
+    ("confidence", pa.float32()),
+    ("source", pa.string()),
+    ("scored_at", pa.timestamp("s")),
+    ("date", pa.string()),
+    ("language", pa.string()),
+])
+CUBE_COLUMNS = ["sentiment", "language", "date"]
+PARTITIONING = ds.partitioning(
+    pa.schema([("date", pa.string()), ("language", pa.string())]), flavor="hive"
+)
+
+
+def _to_table(df):
+    df = pd.DataFrame(df).copy()
+    if "review" not in df.columns and "text" in df.columns:
+        df = df.rename(columns={"text": "review"})
+
+    now = pd.Timestamp(datetime.now()).floor("s")
+    df["scored_at"] = pd.to_datetime(df["scored_at"]) if "scored_at" in df else now
+    df["date"] = df["scored_at"].dt.strftime("%Y-%m-%d")
+    # missing values too: a NaN language would land in __HIVE_DEFAULT_PARTITION__
+    for col in ("language", "source"):
+        df[col] = df[col].fillna("unknown") if col in df.columns else "unknown"
+
+    df["sentiment"] = df["sentiment"].astype(str).str.lower().astype("category")
+    df["confidence"] = df["confidence"].astype("float32")
+    df["review"] = df["review"].astype(str)
+    df["scored_at"] = df["scored_at"].astype("datetime64[s]")
+
+    return pa.Table.from_pandas(df[SCHEMA.names], schema=SCHEMA, preserve_index=False)
+
+
+# ==========================
+#  Results Store
+# ==========================
+class ResultsStore:
+    def __init__(self, root=RESULTS_DIR, cube_path=CUBE_PATH):
+        self.root = root
+        # every append is also folded into the dashboard's count cube (None → off)
+        self.cube_path = cube_path
+
+    # ---------- write ----------
+    def append(self, rows):
+        """Append scored rows (DataFrame or list of dicts) as new Parquet files."""
+        table = _to_table(rows)
+        if not table.num_rows:
+            return 0
+
+        ds.write_dataset(
+            table,
+            self.root,
+            format="parquet",
+            partitioning=PARTITIONING,
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+        if self.cube_path:
+            SentimentCube.record(table.select(CUBE_COLUMNS).to_pylist(), self.cube_path)
+        return table.num_rows
+
+    def rebuild_cube(self):
+        """Recount the cube from every stored row (after a reset or lost file)."""
+        with cube_lock(self.cube_path):
+            cube = SentimentCube(self.cube_path)
+            if os.path.isdir(self.root):
+                for batch in self.dataset().to_batches(columns=CUBE_COLUMNS):
+                    cube.update(batch.to_pylist())
+            cube.save()
+        return cube.total()
+
+    def import_csv(self, path, chunksize=500_000, **defaults):
+        """Load a flat CSV (e.g. sentiment_results.csv) into the store."""
+        total = 0
+        for chunk in pd.read_csv(path, chunksize=chunksize):
+            for col, value in defaults.items():
+                if col not in chunk.columns:
+                    chunk[col] = value
+            total += self.append(chunk)
+        return total
+
+    def compact(self, dates=None, min_files=2):
+        """Rewrite each partition's files as one (many small appends → few large files).
+
+        Only the files listed up front are merged, so parts written meanwhile
+        are left alone. The merged file is staged under .staging/ (hidden from
+        the dataset) and a journal naming the originals is written before any
+        of them is removed; a crash mid-way is finished by _recover().
+        Run one compactor at a time (tail_ingest does it for its partitions).
+        `dates` limits the pass to those date partitions.
+        """
+        if not os.path.isdir(self.root):
+            return
+        self._recover(drop_orphans=True)
+        staging = os.path.join(self.root, STAGING_DIR)
+
+        for date_dir in sorted(os.listdir(self.root)):
+            if date_dir.startswith(".") or (dates and date_dir not in {f"date={d}" for d in dates}):
+                continue
+            for lang_dir in sorted(os.listdir(os.path.join(self.root, date_dir))):
+                part = os.path.join(self.root, date_dir, lang_dir)
+                files = sorted(
+                    os.path.join(part, f) for f in os.listdir(part) if f.endswith(".parquet")
+                )
+                if len(files) < min_files:
+                    continue
+
+                table = ds.dataset(files, format="parquet").to_table()
+                os.makedirs(staging, exist_ok=True)
+                job = uuid.uuid4().hex
+                staged = os.path.join(staging, f"{job}.parquet")
+                pq.write_table(table, staged)
+
+                journal = {"files": files, "staged": staged,
+                           "target": os.path.join(part, f"compact-{job}.parquet")}
+                tmp = os.path.join(staging, f"{job}.json.tmp")
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(journal, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, tmp[:-len(".tmp")])   # commit point
+                self._finish(journal, tmp[:-len(".tmp")])
+
+    def _finish(self, journal, journal_path):
+        # idempotent: a reader's _recover() may race the compactor here
+        for path in journal["files"]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        try:
+            os.replace(journal["staged"], journal["target"])
+        except FileNotFoundError:
+            pass
+        try:
+            os.remove(journal_path)
+        except FileNotFoundError:
+            pass
+
+    def _recover(self, drop_orphans=False):
+        """Complete compactions interrupted after their journal was written.
+
+        Staged files without a journal (crash before the commit point, the
+        originals are untouched) are only dropped by the compactor itself –
+        for a reader they may belong to a compaction still in progress.
+        """
+        staging = os.path.join(self.root, STAGING_DIR)
+        if not os.path.isdir(staging):
+            return
+        names = os.listdir(staging)
+        for name in names:
+            if name.endswith(".json"):
+                path = os.path.join(staging, name)
+                try:
+                    with open(path, encoding="utf-8") as f:
+                        journal = json.load(f)
+                except FileNotFoundError:
+                    continue
+                self._finish(journal, path)
+        if drop_orphans:
+            for name in names:
+                if not name.endswith(".json") and f"{name.split('.')[0]}.json" not in names:
+                    os.remove(os.path.join(staging, name))
+
+    # ---------- read ----------
+    def dataset(self):
+        self._recover()
+        return ds.dataset(self.root, format="parquet", partitioning=PARTITIONING, schema=SCHEMA)
+
+    def _filter(self, start=None, end=None, language=None, sentiment=None, min_confidence=None):
+        expr = None
+
+        def both(a, b):
+            return b if a is None else a & b
+
+        # date / language hit the partition directories → pruned before any file is opened
+        if start:
+            expr = both(expr, pc.field("date") >= str(start))
+        if end:
+            expr = both(expr, pc.field("date") <= str(end))
+        if language:
+            langs = [language] if isinstance(language, str) else list(language)
+            expr = both(expr, pc.field("language").isin(langs))
+        if sentiment:
+            expr = both(expr, pc.field("sentiment") == sentiment)
+        if min_confidence is not None:
+            expr = both(expr, pc.field("confidence") >= min_confidence)
+        return expr
+
+    def query(self, columns=None, limit=None, **filters):
+        """Rows matching `filters`, reading only `columns`."""
+        if not os.path.isdir(self.root):
+            return pd.DataFrame(columns=columns or SCHEMA.names)
+
+        dataset = self.dataset()
+        expr = self._filter(**filters)
+        if limit:
+            table = dataset.head(limit, columns=columns, filter=expr)
+        else:
+            table = dataset.to_table(columns=columns, filter=expr)
+        return table.to_pandas()
+
+    def aggregate(self, by=("date", "sentiment"), **filters):
+        """Review count and mean confidence per group.
+
+        Batches are reduced one at a time in Arrow (partial count/sum per
+        group), so memory stays bounded by the number of groups, not rows.
+        """
+        by = list(by)
+        if not os.path.isdir(self.root):
+            return pd.DataFrame(columns=[*by, "reviews", "mean_confidence"])
+
+        scanner = self.dataset().scanner(columns=by + ["confidence"], filter=self._filter(**filters))
+
+        partials = []
+        for batch in scanner.to_batches():
+            if not batch.num_rows:
+                continue
+            table = pa.Table.from_batches([batch])
+            if "sentiment" in by:
+                table = table.set_column(
+                    table.schema.get_field_index("sentiment"), "sentiment",
+                    pc.cast(table["sentiment"], pa.string())
+                )
+            partials.append(
+                table.group_by(by).aggregate([("confidence", "count"), ("confidence", "sum")])
+            )
+
+        if not partials:
+            return pd.DataFrame(columns=[*by, "reviews", "mean_confidence"])
+
+        out = pa.concat_tables(partials).group_by(by).aggregate(
+            [("confidence_count", "sum"), ("confidence_sum", "sum")]
+        ).to_pandas()
+
+        out["reviews"] = out.pop("confidence_count_sum")
+        out["mean_confidence"] = out.pop("confidence_sum_sum") / out["reviews"]
+        return out[[*by, "reviews", "mean_confidence"]].sort_values(by).reset_index(drop=True)
@@ -0,0 +1,218 @@
+import io
+import os
+import csv
+import json
+from contextlib import contextmanager
+from datetime import date
+from itertools import combinations
+from collections import Counter
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock
+    fcntl = None
+
+from .sentiment_model import has_vietnamese_diacritics
+
+# ==========================
+#  Cube layout
+# ==========================
+# Every subset of DIMENSIONS is kept as its own pre-aggregated cuboid
+# (8 in total), so any group-by / filter combination is answered by a
+# dictionary lookup instead of a scan over the raw scored rows.
+DIMENSIONS = ("product", "language", "day")
+SENTIMENTS = ("positive", "neutral", "negative")
+CUBE_PATH = "data/.cache/sentiment_cube.json"
+KEY_SEP = "\x1f"
+
+
+def _cuboid_name(dims):
+    return ",".join(d for d in DIMENSIONS if d in dims)
+
+
+ALL_CUBOIDS = [
+    _cuboid_name(c)
+    for n in range(len(DIMENSIONS) + 1)
+    for c in combinations(DIMENSIONS, n)
+]
+
+
+def normalize_row(row):
+    """Map a scored row (dict) onto the cube dimensions."""
+    text = str(row.get("review") or row.get("text") or "")
+
+    product = str(row.get("product") or "unknown").strip() or "unknown"
+
+    language = row.get("language") or row.get("lang")
+    if not language:
+        # diacritics only: is_vietnamese() claims English text without hint words
+        language = "Vietnamese" if has_vietnamese_diacritics(text) else "English"
+
+    day = row.get("day") or row.get("date") or row.get("timestamp")
+    day = str(day)[:10] if day else date.today().isoformat()
+
+    sentiment = str(row.get("sentiment") or row.get("label") or "neutral").lower()
+
+    return {"product": product, "language": str(language), "day": day}, sentiment
+
+
+@contextmanager
+def cube_lock(path=CUBE_PATH):
+    """Serialize load → update → save between writers (Streamlit, tail_ingest)."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(f"{path}.lock", "w") as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
+# ==========================
+#  Sentiment Cube
+# ==========================
+class SentimentCube:
+    def __init__(self, path=CUBE_PATH):
+        self.path = path
+        self.cuboids = {name: {} for name in ALL_CUBOIDS}
+        # per source file: inode, byte offset and header → incremental CSV ingestion
+        self.offsets = {}
+
+    # ---------- incremental updates ----------
+    def add(self, row, count=1):
+        coords, sentiment = normalize_row(row)
+        for name in ALL_CUBOIDS:
+            dims = name.split(",") if name else []
+            key = KEY_SEP.join(coords[d] for d in dims)
+            cell = self.cuboids[name].setdefault(key, Counter())
+            cell[sentiment] += count
+
+    def update(self, rows):
+        n = 0
+        for row in rows:
+            self.add(row)
+            n += 1
+        return n
+
+    def ingest_csv(self, csv_path):
+        """Add only the rows appended to `csv_path` since the last ingest.
+
+        Reading starts at the stored byte offset, so a sync costs O(new rows).
+        Raises ValueError if the file was replaced or truncated: its old
+        rows are already counted and cannot be told apart – call reset().
+        """
+        csv_path = str(csv_path)
+        st = os.stat(csv_path)
+        state = self.offsets.get(csv_path)
+        if not isinstance(state, dict):
+            state = None  # cubes saved before byte offsets → start over for this file
+
+        if state and (state["inode"] != st.st_ino or st.st_size < state["offset"]):
+            raise ValueError(
+                f"{csv_path} was replaced or truncated since the last sync; "
+                "reset and rebuild the cube to avoid stale counts."
+            )
+
+        offset = state["offset"] if state else 0
+        header = state["header"] if state else None
+        added = 0
+
+        with open(csv_path, "rb") as f:
+            f.seek(offset)
+            buffer, buffer_bytes = "", 0
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # partial last line → picked up next sync
+                buffer += raw.decode("utf-8")
+                buffer_bytes += len(raw)
+                if buffer.count('"') % 2:
+                    continue  # newline inside a quoted field
+
+                record = next(csv.reader(io.StringIO(buffer)), [])
+                offset += buffer_bytes
+                buffer, buffer_bytes = "", 0
+
+                if not record:
+                    continue
+                if header is None:
+                    header = record
+                    continue
+                self.add(dict(zip(header, record)))
+                added += 1
+
+        self.offsets[csv_path] = {"inode": st.st_ino, "offset": offset, "header": header}
+        return added
+
+    @classmethod
+    def record(cls, rows, path=CUBE_PATH):
+        """Fold freshly scored rows into the cube file; returns rows added."""
+        with cube_lock(path):
+            cube = cls.load(path)
+            added = cube.update(rows)
+            cube.save()
+        return added
+
+    def reset(self):
+        self.cuboids = {name: {} for name in ALL_CUBOIDS}
+        self.offsets = {}
+
+    # ---------- queries ----------
+    def distribution(self, by=(), where=None):
+        """Sentiment counts grouped by `by`, filtered by `where` (dim → value).
+
+        Only the smallest cuboid covering by ∪ where is touched, so a
+        drill-down reads just the requested slice.
+        """
+        where = where or {}
+        unknown = (set(by) | set(where)) - set(DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Unknown cube dimensions: {sorted(unknown)}")
+
+        name = _cuboid_name(set(by) | set(where))
+        dims = name.split(",") if name else []
+
+        result = {}
+        for key, counts in self.cuboids[name].items():
+            coords = dict(zip(dims, key.split(KEY_SEP))) if dims else {}
+            if any(coords[d] != str(v) for d, v in where.items()):
+                continue
+            group = tuple(coords[d] for d in by)
+            bucket = result.setdefault(group, Counter())
+            bucket.update(counts)
+
+        return result
+
+    def members(self, dim, where=None):
+        return sorted({g[0] for g in self.distribution(by=(dim,), where=where)})
+
+    def total(self):
+        return sum(self.cuboids[""].get("", Counter()).values())
+
+    # ---------- persistence ----------
+    def save(self, path=None):
+        path = path or self.path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        payload = {
+            "cuboids": {
+                name: {k: dict(v) for k, v in cells.items()}
+                for name, cells in self.cuboids.items()
+            },
+            "offsets": self.offsets,
+        }
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path=CUBE_PATH):
+        cube = cls(path)
+        if not os.path.exists(path):
+            return cube
+
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+
+        for name, cells in payload.get("cuboids", {}).items():
+            if name in cube.cuboids:
+                cube.cuboids[name] = {k: Counter(v) for k, v in cells.items()}
+        cube.offsets = payload.get("offsets", {})
+        return cube
@@ -9,8 +9,12 @@ from sklearn.linear_model import LogisticRegression
 # ==========================
 VI_CHARS = r"àáạảãâầấậẩẫăằắặẳẵđêềếệểễôồốộổỗơờớợởỡưừứựửữíìịỉĩúùụủũýỳỵỷỹ"
 
+def has_vietnamese_diacritics(text: str) -> bool:
+    return bool(re.search(f"[{VI_CHARS}]", text.lower()))
+
+
 def is_vietnamese(text: str) -> bool:
-    if re.search(f"[{VI_CHARS}]", text.lower()):
+    if has_vietnamese_diacritics(text):
         return True
     english_hint = r"\b(the|this|that|is|are|good|bad)\b"
     return not bool(re.search(english_hint, text.lower()))
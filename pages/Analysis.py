@@ -8,9 +8,15 @@ from utils_ui import (
     gauge_chart,
     colored_tag,
     save_history,
-    load_custom_css
+    load_custom_css,
+    show_server_time_to_result,
+    cached_english_model
 )
-from models import load_english_model, is_vietnamese, vietnamese_sentiment
+from models import is_vietnamese, vietnamese_sentiment
+from models.profiling import profiled, annotate, text_metadata
+
+
+@profiled("page:Analysis")
 def show():
     # Load custom CSS
     load_custom_css()
@@ -18,7 +24,7 @@ def show():
     st.markdown("<h3>Analysis – Sentiment Analysis (VN + ENG) – Enhanced</h3>", unsafe_allow_html=True)
 
     # Load English model
-    model_en, vec_en = load_english_model()
+    model_en, vec_en = cached_english_model()
 
     # Dark mode toggle
     dark = st.toggle("🌙 Dark Mode")
@@ -38,9 +44,11 @@ def show():
         if not review.strip():
             st.warning("Please enter your review.")
         else:
-            # Beautiful loading animation
-            loading_skeleton(4)
-            time.sleep(1)
+            start = time.perf_counter()
+            annotate(**text_metadata(review))
+
+            # Beautiful loading animation (pure CSS, cleared as soon as the result is ready)
+            skeleton = loading_skeleton(4)
 
             # Auto detect language
             if is_vietnamese(review):
@@ -52,8 +60,10 @@ def show():
                 confidence = float(model_en.predict_proba(X).max())
                 lang = "English"
 
+            skeleton.empty()
+
             # Save history
-            save_history(review, sentiment, confidence)
+            save_history(review, sentiment, confidence, lang)
 
             # Animated typing AI response
             ai_typing(f"Detected language: **{lang}**")
@@ -64,6 +74,8 @@ def show():
             # Gauge meter
             gauge_chart(confidence)
 
+            show_server_time_to_result(start, "Analysis")
+
     # HISTORY SECTION
     if "history" in st.session_state:
         st.subheader("📜 History")
@@ -75,3 +87,11 @@ def show():
             df.to_csv(index=False),
             "history.csv"
         )
+
+        if st.button("💾 Save History to Results Store"):
+            from models.results_store import ResultsStore
+            # only entries added since the last save → no duplicate rows in the store
+            done = st.session_state.get("history_saved", 0)
+            saved = ResultsStore().append(df.iloc[done:]) if len(df) > done else 0
+            st.session_state.history_saved = len(df)
+            st.success(f"✅ {saved} new results saved → data/results (Parquet)")
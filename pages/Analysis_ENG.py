@@ -1,10 +1,16 @@
-from utils_ui import ai_typing, loading_skeleton, gauge_chart, colored_tag, save_history
+import streamlit as st
+import pandas as pd
+import time
 
+from utils_ui import ai_typing, loading_skeleton, gauge_chart, colored_tag, save_history, show_server_time_to_result, cached_english_model
+from models.profiling import profiled, annotate, text_metadata
+
+@profiled("page:Analysis_ENG")
 def show():
     st.markdown("<div class='page-title'>🇺🇸 English Sentiment Analysis – AI Enhanced</div>", unsafe_allow_html=True)
     st.write("Analyze English product reviews with animations, gauge meter, and history tracking.")
 
-    model, vectorizer = load_demo_model()
+    model, vectorizer = cached_english_model()
 
     # Dark mode toggle
     dark = st.toggle("🌙 Dark Mode")
@@ -20,14 +26,17 @@ def show():
         if not review.strip():
             st.warning("Please enter your review.")
         else:
-            loading_skeleton(5)
-            time.sleep(1.2)
+            start = time.perf_counter()
+            annotate(**text_metadata(review))
+            skeleton = loading_skeleton(5)
 
             X = vectorizer.transform([review])
             pred = model.predict(X)[0]
             proba = float(model.predict_proba(X).max())
 
-            save_history(review, pred, proba)
+            skeleton.empty()
+
+            save_history(review, pred, proba, "English")
 
             st.success("Analysis Complete!")
             ai_typing(f"Sentiment detected: **{pred.upper()}**")
@@ -36,6 +45,8 @@ def show():
             st.info(f"Confidence Score: **{proba:.2f}**")
             gauge_chart(proba)
 
+            show_server_time_to_result(start, "Analysis_ENG")
+
     st.markdown("</div>", unsafe_allow_html=True)
 
     # ============================
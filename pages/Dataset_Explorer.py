@@ -1,11 +1,33 @@
 import streamlit as st
 import pandas as pd
+from pathlib import Path
 
+from models import load_english_model, SentimentCascade
+from models.cascade import DEFAULT_THRESHOLDS
+from models.batch_scoring import score_bulk
+from utils_ui import keyword_search_panel
+from models.profiling import profiled
+
+@profiled("page:Dataset_Explorer")
 def show():
     st.header("📊 Dataset Explorer")
 
     st.info("Upload dataset để xem nhanh cấu trúc dữ liệu.")
 
+    # =============================
+    # Keyword search over /data files
+    # =============================
+    csv_files = sorted(Path("data").glob("*.csv"))
+    if csv_files:
+        with st.expander("🔍 Keyword Search (data/*.csv)"):
+            path = st.selectbox("Dataset file:", csv_files, format_func=lambda x: x.name)
+            columns = list(pd.read_csv(path, nrows=0).columns)
+            text_col = st.selectbox("Text column:", columns, key="kw_text")
+            label_col = st.selectbox("Label column:", ["(none)", *columns], key="kw_label")
+            keyword_search_panel(
+                path, text_col, None if label_col == "(none)" else label_col, key="explorer"
+            )
+
     file = st.file_uploader("Upload CSV", type=["csv"])
 
     if file:
@@ -18,3 +40,54 @@ def show():
 
         st.subheader("Statistics")
         st.write(df.describe())
+
+        # =============================
+        # Bulk scoring (near-duplicate aware)
+        # =============================
+        st.subheader("🧠 Bulk Sentiment Scoring")
+
+        text_col = st.selectbox("Text column:", df.columns)
+        dedup = st.checkbox("Group near-duplicates (MinHash/LSH)", value=True)
+        similarity = st.slider("Similarity threshold", 0.5, 1.0, 0.8, 0.05, disabled=not dedup)
+        use_cascade = st.checkbox("Lexicon-first cascade (model only for ambiguous reviews)", value=False)
+
+        if st.button("▶️ Score dataset"):
+            model_en, vec_en = load_english_model()
+            cascade = SentimentCascade(model_en, vec_en) if use_cascade else None
+            results, stats = score_bulk(
+                df[text_col].astype(str).tolist(), model_en, vec_en,
+                similarity=similarity, dedup=dedup,
+                scorer=cascade.score if cascade else None
+            )
+
+            scored = df.copy()
+            scored["sentiment"] = [r[0] for r in results]
+            scored["confidence"] = [round(r[1], 3) for r in results]
+            scored["language"] = [r[2] for r in results]
+            scored["group"] = stats["group_of"]
+            if cascade:
+                scored["path"] = [r[3] for r in results]
+
+            c1, c2, c3 = st.columns(3)
+            c1.metric("Reviews", f"{stats['items']:,}")
+            c2.metric("Unique groups", f"{stats['groups']:,}", f"-{stats['dedup_rate']:.1%} dedup")
+            c3.metric("Inference saved (est.)", f"{stats['saved_inference_sec']:.2f}s")
+            st.caption(
+                f"Grouping {stats['grouping_sec']:.2f}s • Inference {stats['inference_sec']:.2f}s"
+            )
+            if cascade:
+                st.caption(
+                    f"Cascade: {stats['lexicon_fraction']:.1%} lexicon • "
+                    f"{stats['model_fraction']:.1%} model • thresholds {cascade.thresholds}"
+                )
+                if cascade.thresholds == DEFAULT_THRESHOLDS:
+                    st.info("Cascade chưa hiệu chỉnh → mọi review đi qua model. "
+                            "Chạy `python -m models.cascade <reviews.csv>` để hiệu chỉnh ngưỡng.")
+
+            st.dataframe(scored, use_container_width=True)
+            st.download_button(
+                "⬇️ Download scored CSV",
+                scored.to_csv(index=False),
+                "scored_dataset.csv",
+                "text/csv"
+            )
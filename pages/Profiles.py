@@ -0,0 +1,63 @@
+import streamlit as st
+import pandas as pd
+from pathlib import Path
+
+from models import profiling
+
+
+def show():
+    st.header("🔥 Slow-Request Profiles")
+
+    status = "ON" if profiling.settings["enabled"] else "OFF"
+    st.info(
+        f"Profiling is **{status}** • threshold {profiling.settings['threshold_ms']:.0f} ms • "
+        f"cProfile sample rate {profiling.settings['sample_rate']:.0%}. "
+        "Bật bằng biến môi trường SENTIMENT_PROFILE=1."
+    )
+
+    captures = profiling.list_captures()
+    if not captures:
+        st.warning("No slow requests captured yet.")
+        return
+
+    # =============================
+    # Capture list
+    # =============================
+    table = pd.DataFrame(captures)
+    cols = [c for c in ["captured_at", "name", "elapsed_ms", "full_profile", "samples",
+                        "input_chars", "batch_size", "input_preview"] if c in table.columns]
+    st.dataframe(table[cols], use_container_width=True)
+
+    chosen = st.selectbox(
+        "Capture:",
+        captures,
+        format_func=lambda c: f"{c['captured_at']} • {c['name']} • {c['elapsed_ms']:.0f} ms"
+    )
+
+    # =============================
+    # Flame graph
+    # =============================
+    st.subheader("🔥 Flame Graph")
+    stacks = profiling.read_collapsed(chosen["path"])
+    if stacks:
+        st.markdown(
+            f"<div style='overflow-x:auto'>{profiling.flamegraph_svg(stacks)}</div>",
+            unsafe_allow_html=True
+        )
+    else:
+        st.caption("Call finished before the first stack sample.")
+
+    # =============================
+    # pstats (sampled captures only)
+    # =============================
+    if chosen.get("full_profile"):
+        st.subheader("📋 Top Functions (cProfile)")
+        sort = st.radio("Sort by:", ["cumulative", "tottime"], horizontal=True)
+        st.dataframe(pd.DataFrame(profiling.top_functions(chosen["path"], sort=sort)), use_container_width=True)
+
+    st.subheader("⬇️ Downloads")
+    st.json({k: v for k, v in chosen.items() if k != "path"}, expanded=False)
+    for name, mime in [("stacks.collapsed", "text/plain"), ("profile.pstats", "application/octet-stream")]:
+        path = Path(chosen["path"]) / name
+        if path.exists():
+            st.download_button(f"⬇️ {name}", path.read_bytes(), f"{chosen['id']}-{name}", mime, key=name)
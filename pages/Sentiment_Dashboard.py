@@ -0,0 +1,96 @@
+import streamlit as st
+import pandas as pd
+import io
+import os
+import csv
+
+from models.sentiment_cube import SentimentCube, SENTIMENTS, DIMENSIONS, CUBE_PATH, cube_lock
+from models.results_store import ResultsStore
+from models.profiling import profiled
+
+LEGACY_CSV = "sentiment_results.csv"
+
+
+@st.cache_resource(max_entries=1)
+def get_cube(mtime):
+    # keyed by mtime: tail_ingest / history saves update the file in the background
+    return SentimentCube.load(CUBE_PATH)
+
+
+def cube_mtime():
+    return os.stat(CUBE_PATH).st_mtime_ns if os.path.exists(CUBE_PATH) else 0
+
+
+def to_frame(dist, dim):
+    rows = [
+        {dim: group[0], **{s: counts.get(s, 0) for s in SENTIMENTS}}
+        for group, counts in dist.items()
+    ]
+    if not rows:
+        return pd.DataFrame(columns=[dim, *SENTIMENTS]).set_index(dim)
+    return pd.DataFrame(rows).set_index(dim).sort_index()
+
+
+@profiled("page:Sentiment_Dashboard")
+def show():
+    st.header("📉 Sentiment Dashboard")
+    st.info("Biểu đồ được đọc từ các khối đếm (count cube) đã tổng hợp sẵn – không quét lại dữ liệu gốc. "
+            "Mọi kết quả ghi vào results store (tail_ingest, lưu lịch sử) được cộng vào cube ngay khi ghi.")
+
+    # =============================
+    # Manual ingestion (results store rows arrive on their own)
+    # =============================
+    with st.expander("➕ Ingest scored rows"):
+        if os.path.exists(LEGACY_CSV) and st.button(f"🔄 Sync {LEGACY_CSV}"):
+            try:
+                with cube_lock(CUBE_PATH):
+                    cube = SentimentCube.load(CUBE_PATH)
+                    added = cube.ingest_csv(LEGACY_CSV)
+                    cube.save()
+                st.success(f"Added {added} new rows.")
+            except ValueError as e:
+                st.warning(f"⚠️ {e} Use the rebuild button below.")
+
+        if st.button("♻️ Rebuild cube from the results store"):
+            with st.spinner("Recounting stored results..."):
+                total = ResultsStore().rebuild_cube()
+            st.success(f"Cube rebuilt from {total:,} stored rows (CSV and uploaded rows were dropped).")
+
+        file = st.file_uploader("Upload scored CSV (review, sentiment, product, date…)", type=["csv"])
+        if file and st.button("📥 Add uploaded rows"):
+            reader = csv.DictReader(io.StringIO(file.getvalue().decode("utf-8")))
+            added = SentimentCube.record(reader, CUBE_PATH)
+            st.success(f"Added {added} new rows.")
+
+    cube = get_cube(cube_mtime())
+    total = cube.total()
+    st.metric("Scored reviews", f"{total:,}")
+    if not total:
+        st.warning("Cube is empty – ingest some scored rows first.")
+        return
+
+    # =============================
+    # Overall distribution
+    # =============================
+    overall = cube.distribution()[()]
+    cols = st.columns(len(SENTIMENTS))
+    for col, s in zip(cols, SENTIMENTS):
+        col.metric(s.capitalize(), f"{overall.get(s, 0):,}")
+
+    # =============================
+    # Drill-down
+    # =============================
+    st.subheader("🔎 Drill-down")
+
+    where = {}
+    filter_cols = st.columns(len(DIMENSIONS))
+    for col, dim in zip(filter_cols, DIMENSIONS):
+        choice = col.selectbox(dim.capitalize(), ["(all)", *cube.members(dim)], key=f"cube_{dim}")
+        if choice != "(all)":
+            where[dim] = choice
+
+    group_by = st.radio("Group by:", DIMENSIONS, horizontal=True, index=2)
+
+    df = to_frame(cube.distribution(by=(group_by,), where=where), group_by)
+    st.bar_chart(df)
+    st.dataframe(df, use_container_width=True)
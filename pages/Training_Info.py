@@ -11,6 +11,11 @@ from pathlib import Path
 import time
 import matplotlib.pyplot as plt
 
+from utils_ui import keyword_search_panel
+from models.kfold_eval import evaluate_kfold
+from models.profiling import profiled
+
+@profiled("page:Training_Info")
 def show():
     st.markdown("## ⚙️ Model Training – PRO Dashboard")
 
@@ -23,7 +28,11 @@ def show():
     # =============================
     st.subheader("📂 Load Training Dataset")
 
-    files = list(data_dir.glob("*.*"))
+    # only loadable datasets (skips index/cache folders and derived state files)
+    files = [
+        f for f in data_dir.glob("*.*")
+        if f.is_file() and f.suffix.lower() in (".csv", ".xls", ".xlsx", ".txt")
+    ]
 
     if not files:
         st.error("❌ No dataset in /data. Please upload files.")
@@ -62,6 +71,10 @@ def show():
     text_col = st.selectbox("Text column:", df.columns)
     label_col = st.selectbox("Label column:", df.columns)
 
+    if ext == ".csv" and text_col != label_col:
+        with st.expander("🔍 Keyword Search"):
+            keyword_search_panel(file_selected, text_col, label_col, key="training")
+
     # =============================
     # Select model type
     # =============================
@@ -76,6 +89,43 @@ def show():
         ]
     )
 
+    # =============================
+    # K-fold evaluation (cached)
+    # =============================
+    st.subheader("🧪 K-Fold Evaluation")
+
+    k = st.slider("Number of folds (k):", 3, 10, 5)
+
+    if st.button("📐 Run K-Fold Evaluation"):
+        if text_col == label_col:
+            st.error("Text column and label column must be different!")
+            return
+
+        data = df[[text_col, label_col]].dropna()
+
+        with st.spinner(f"Evaluating {algo} with {k}-fold CV..."):
+            t0 = time.perf_counter()
+            try:
+                result = evaluate_kfold(
+                    data[text_col].astype(str).tolist(), data[label_col].tolist(), algo, k=k
+                )
+            except ValueError as e:
+                st.error(f"K-fold evaluation failed: {e}")
+                return
+            elapsed = time.perf_counter() - t0
+
+        c1, c2, c3 = st.columns(3)
+        c1.metric("Accuracy", f"{result['accuracy_mean']:.4f}", f"± {result['accuracy_std']:.4f}", delta_color="off")
+        c2.metric("Fit time / fold", f"{result['fit_time_mean']:.2f}s")
+        c3.metric("Inference", f"{result['throughput_mean']:,.0f} reviews/s")
+        st.caption(f"Dataset hash {result['dataset_hash']} • computed/loaded in {elapsed:.2f}s")
+
+        st.markdown("**Per-class F1**")
+        st.bar_chart(pd.Series(result["f1_per_class"], name="F1"))
+
+        st.markdown("**Accuracy per fold**")
+        st.bar_chart(pd.Series(result["fold_accuracy"], index=[f"fold {i + 1}" for i in range(k)], name="accuracy"))
+
     # =============================
     # Train button
     # =============================
@@ -0,0 +1,190 @@
+# ======================================================
+# 🚀 MULTI-WORKER PREDICTION SERVER (pre-fork, shared model memory)
+# FastAPI + Uvicorn • model loaded ONCE in the parent, workers fork
+#
+#   python serve.py --workers 8                 # preload + fork (shared)
+#   python serve.py --workers 8 --mode independent   # each worker loads its own copy
+#   python serve.py --workers 8 --report-memory --corpus data/reviews.csv
+#                                   # per-worker RSS/PSS/USS before/after a load_test run
+# ======================================================
+
+import os
+import gc
+import sys
+import time
+import signal
+import socket
+import argparse
+
+import uvicorn
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from models import load_english_model
+from models.batch_scoring import score_texts
+from models.frozen_vectorizer import FrozenVectorizer
+
+
+# ======================================================
+# 🧠 APP
+# ======================================================
+class PredictRequest(BaseModel):
+    texts: list[str]
+
+
+def create_app(model=None, vectorizer=None):
+    # "independent" mode: every worker pays for its own joblib.load
+    if model is None:
+        model, vectorizer = load_english_model()
+
+    app = FastAPI(title="Sentiment API")
+    state = {"model": model, "vectorizer": vectorizer}
+
+    @app.get("/health")
+    def health():
+        return {"pid": os.getpid()}
+
+    @app.post("/predict")
+    def predict(req: PredictRequest):
+        results = score_texts(req.texts, state["model"], state["vectorizer"])
+        return {
+            "pid": os.getpid(),
+            "results": [
+                {"sentiment": s, "confidence": round(c, 4), "language": lang}
+                for s, c, lang in results
+            ],
+        }
+
+    return app
+
+
+# ======================================================
+# 📏 MEMORY MEASUREMENT (Linux /proc)
+# ======================================================
+def memory_usage(pid):
+    """RSS / PSS / USS in MB from /proc/<pid>/smaps_rollup (None if unavailable).
+
+    RSS counts shared pages in every worker; PSS splits them between the
+    sharers and USS (private pages) is what each worker really adds.
+    """
+    fields = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 3 and parts[0].endswith(":"):
+                    fields[parts[0][:-1]] = int(parts[1])
+    except OSError:
+        return None
+
+    return {
+        "rss_mb": fields.get("Rss", 0) / 1024,
+        "pss_mb": fields.get("Pss", 0) / 1024,
+        "uss_mb": (fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)) / 1024,
+    }
+
+
+def drive_load(host, port, corpus=None, text_col="text", clients=32, duration=20.0, batch=8):
+    """One closed-loop load_test.py level against the workers.
+
+    Shared pages only get copied as requests touch them, so memory is
+    measured after traffic that spreads over the real vocabulary – pass a
+    corpus of real reviews; the synthetic mix only covers a few terms.
+    """
+    import load_test
+
+    texts = load_test.load_corpus(corpus, text_col) if corpus else load_test.synthetic_corpus()
+    args = argparse.Namespace(mode="closed", duration=duration, batch=batch, rate=0.0)
+    call = load_test.http_target(f"http://{host}:{port}/predict")
+    return load_test.run_level(call, texts, clients, args)
+
+
+def report_memory(pids, mode):
+    rows = [dict(pid=pid, **(memory_usage(pid) or {})) for pid in pids]
+    print(f"\n📏 Per-worker memory ({mode}, {len(pids)} workers)")
+    print(f"{'pid':>8} {'RSS MB':>9} {'PSS MB':>9} {'USS MB':>9}")
+    for r in rows:
+        print(f"{r['pid']:>8} {r.get('rss_mb', 0):>9.1f} {r.get('pss_mb', 0):>9.1f} {r.get('uss_mb', 0):>9.1f}")
+    total_pss = sum(r.get("pss_mb", 0) for r in rows)
+    print(f"{'total PSS':>8} {total_pss:>9.1f} MB\n")
+    return rows
+
+
+# ======================================================
+# 🍴 PRE-FORK WORKER POOL
+# ======================================================
+def serve(workers=os.cpu_count(), host="127.0.0.1", port=8000, mode="preload",
+          memory_report=False, corpus=None, text_col="text", load_seconds=20.0):
+    model = vectorizer = None
+    if mode == "preload":
+        model, vectorizer = load_english_model()
+        # Refcounting still writes to every shared Python object a worker
+        # touches, so gc.freeze alone does not keep the model shared: each
+        # vocabulary_ lookup increfs an int and dirties its page. Swap the
+        # dict for numpy arrays (FrozenVectorizer) so prediction only reads
+        # array buffers (vocabulary, idf_, coef_). gc.freeze then keeps the
+        # children's collections from touching the remaining headers.
+        vectorizer = FrozenVectorizer(vectorizer)
+        gc.collect()
+        gc.freeze()
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+
+    children = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            config = uvicorn.Config(create_app(model, vectorizer), log_level="warning")
+            uvicorn.Server(config).run(sockets=[sock])
+            os._exit(0)
+        children.append(pid)
+
+    print(f"🚀 {workers} workers ({mode}) on http://{host}:{port} — pids {children}")
+
+    def shutdown(*_):
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    if memory_report:
+        time.sleep(2)
+        report_memory(children, f"{mode}, idle")
+        level = drive_load(host, port, corpus, text_col, clients=4 * workers, duration=load_seconds)
+        print(f"🔥 load: {level['requests']} requests, {level['throughput_rps']:.0f} req/s, "
+              f"errors {level['error_rate']:.1%}")
+        report_memory(children, f"{mode}, after load")
+
+    for pid in children:
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Multi-worker sentiment API")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--mode", choices=["preload", "independent"], default="preload")
+    parser.add_argument("--report-memory", action="store_true")
+    parser.add_argument("--corpus", help="reviews driven through the workers before the memory report")
+    parser.add_argument("--text-col", default="text")
+    parser.add_argument("--load-seconds", type=float, default=20.0)
+    args = parser.parse_args()
+
+    if not hasattr(os, "fork"):
+        sys.exit("❌ Pre-fork serving needs os.fork (Linux/macOS).")
+
+    serve(args.workers, args.host, args.port, args.mode, args.report_memory,
+          args.corpus, args.text_col, args.load_seconds)
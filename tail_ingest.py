@@ -0,0 +1,274 @@
+# ======================================================
+# 📡 TAIL-FOLLOW INGESTION – score appended reviews continuously
+#
+#   python tail_ingest.py data/reviews.jsonl data/collector.csv
+#   python tail_ingest.py requests.jsonl --text-field body --once
+#
+# Only complete new records are scored, in micro-batches (near-duplicates
+# once per group), and buffered into the partitioned Parquet results store
+# (a quoted CSV field may span several lines). Writes are flushed by size or
+# age and the touched partitions compacted periodically. Byte offsets are
+# checkpointed at record boundaries after each flush, so a restart resumes
+# exactly where it stopped;
+# rotated (renamed/recreated) and truncated files are detected by inode
+# and size.
+# ======================================================
+
+import os
+import csv
+import io
+import json
+import time
+import argparse
+from datetime import datetime
+
+from models import load_english_model
+from models.batch_scoring import score_bulk
+from models.results_store import ResultsStore, RESULTS_DIR
+
+CHECKPOINT_PATH = "data/.cache/tail_checkpoints.json"
+
+# ================================
+# 🎨 Terminal Colors
+# ================================
+OK = "\033[92m"
+INFO = "\033[94m"
+WARN = "\033[93m"
+END = "\033[0m"
+
+
+# ======================================================
+# 💾 CHECKPOINTS
+# ======================================================
+def load_checkpoints(path=CHECKPOINT_PATH):
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def save_checkpoints(checkpoints, path=CHECKPOINT_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(checkpoints, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+# ======================================================
+# 📄 FOLLOWED FILE
+# ======================================================
+class FollowedFile:
+    def __init__(self, path, state=None, text_field="text"):
+        self.path = path
+        self.text_field = text_field
+        self.is_csv = path.lower().endswith(".csv")
+        self.handle = None
+        self.inode = None
+        self.offset = 0
+        self.header = None
+
+        state = state or {}
+        self._open(resume=state)
+
+    def _open(self, resume=None):
+        if self.handle:
+            self.handle.close()
+        self.handle = None
+        if not os.path.exists(self.path):
+            return
+
+        self.handle = open(self.path, "rb")
+        self.inode = os.fstat(self.handle.fileno()).st_ino
+        self.offset, self.header = 0, None
+
+        # resume only if the checkpoint describes this very file
+        if resume and resume.get("inode") == self.inode and resume.get("offset", 0) <= os.path.getsize(self.path):
+            self.offset = resume["offset"]
+            self.header = resume.get("header")
+        self.handle.seek(self.offset)
+
+    def state(self):
+        return {"inode": self.inode, "offset": self.offset, "header": self.header}
+
+    def _read_records(self, limit):
+        """Up to `limit` complete records; the offset only moves past whole records."""
+        records = []
+        pending, quotes = b"", 0
+        while len(records) < limit:
+            line = self.handle.readline()
+            if not line or not line.endswith(b"\n"):
+                break  # EOF or partial write – leave it for the next poll
+
+            pending += line
+            quotes += line.count(b'"')
+            if self.is_csv and quotes % 2:
+                continue  # newline inside a quoted CSV field
+
+            self.offset += len(pending)
+            records.append(pending.decode("utf-8", errors="replace"))
+            pending, quotes = b"", 0
+
+        # rewind over any partial line / unfinished record
+        self.handle.seek(self.offset)
+        return records
+
+    def poll(self, limit):
+        """Return (records read, review texts) for up to `limit` new records.
+
+        Blank or unparsable records count as read but yield no text.
+        """
+        if self.handle is None:
+            self._open()
+            if self.handle is None:
+                return 0, []
+
+        records = self._read_records(limit)
+
+        if not records:
+            try:
+                st = os.stat(self.path)
+            except FileNotFoundError:
+                return 0, []  # rotated away, new file not created yet
+
+            if st.st_ino != self.inode:
+                # rotation: the old handle is drained above, switch to the new file
+                print(f"{WARN}🔁 {self.path} rotated → following new file{END}")
+                self._open()
+                records = self._read_records(limit)
+            elif st.st_size < self.offset:
+                print(f"{WARN}✂️  {self.path} truncated → restarting from byte 0{END}")
+                self.offset, self.header = 0, None
+                self.handle.seek(0)
+                records = self._read_records(limit)
+
+        return len(records), [t for t in (self._parse(r) for r in records) if t]
+
+    def _parse(self, record):
+        if not record.strip():
+            return None
+
+        if self.is_csv:
+            row = next(csv.reader(io.StringIO(record)))
+            if self.header is None:
+                self.header = row
+                return None
+            record = dict(zip(self.header, row))
+        else:
+            try:
+                record = json.loads(record)
+            except json.JSONDecodeError:
+                return None
+            if not isinstance(record, dict):
+                return str(record)
+
+        return record.get(self.text_field) or record.get("review") or record.get("text")
+
+
+# ======================================================
+# 🔄 FOLLOW LOOP
+# ======================================================
+def follow(paths, text_field="text", batch_size=256, interval=1.0, once=False,
+           output=RESULTS_DIR, checkpoint_path=CHECKPOINT_PATH,
+           flush_rows=50_000, flush_seconds=60.0, compact_seconds=3600.0):
+    """Score new records as they arrive and write them to the results store.
+
+    Scored rows are buffered and written once `flush_rows` rows or
+    `flush_seconds` have accumulated, so a busy follower does not leave one
+    tiny Parquet file per poll; the partitions it wrote to are compacted
+    every `compact_seconds`.
+    """
+    model, vectorizer = load_english_model()
+    store = ResultsStore(output)
+    checkpoints = load_checkpoints(checkpoint_path)
+    files = [FollowedFile(p, checkpoints.get(os.path.abspath(p)), text_field) for p in paths]
+
+    print(f"{INFO}📡 Following {len(files)} file(s) → {output}{END}")
+    total = 0
+    pending, pending_states = [], {}
+    pending_since = None
+    touched_dates = set()
+    last_compact = time.monotonic()
+
+    def flush():
+        nonlocal pending_since
+        if pending:
+            store.append(pending)
+            touched_dates.update(r["scored_at"].date().isoformat() for r in (pending[0], pending[-1]))
+            print(f"{OK}💾 Wrote {len(pending)} rows{END}")
+        # checkpoint only after the rows are durably written (at-least-once)
+        checkpoints.update(pending_states)
+        save_checkpoints(checkpoints, checkpoint_path)
+        pending.clear()
+        pending_states.clear()
+        pending_since = None
+
+    try:
+        while True:
+            read_this_round = scored_this_round = 0
+            for f in files:
+                read, texts = f.poll(batch_size)
+                read_this_round += read
+                if texts:
+                    # near-duplicate reviews are scored once per group
+                    results, _ = score_bulk(texts, model, vectorizer)
+                    now = datetime.now().replace(microsecond=0)
+                    pending.extend(
+                        {"review": t, "sentiment": s, "confidence": c, "language": lang,
+                         "source": f.path, "scored_at": now}
+                        for t, (s, c, lang) in zip(texts, results)
+                    )
+                    scored_this_round += len(texts)
+                if read:
+                    pending_states[os.path.abspath(f.path)] = f.state()
+
+            if read_this_round and pending_since is None:
+                pending_since = time.monotonic()
+            if scored_this_round:
+                total += scored_this_round
+                print(f"{OK}✅ Scored {scored_this_round} new reviews (total {total}){END}")
+
+            if len(pending) >= flush_rows or (
+                pending_since is not None and time.monotonic() - pending_since >= flush_seconds
+            ):
+                flush()
+
+            if touched_dates and time.monotonic() - last_compact >= compact_seconds:
+                store.compact(dates=touched_dates)
+                touched_dates.clear()
+                last_compact = time.monotonic()
+
+            # caught up = nothing left to read (a batch of blank lines is not idle)
+            if not read_this_round:
+                if once:
+                    break
+                time.sleep(interval)
+    finally:
+        flush()
+
+    return total
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tail JSONL/CSV files and score new reviews")
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--text-field", default="text")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between polls when idle")
+    parser.add_argument("--output", default=RESULTS_DIR, help="results store root")
+    parser.add_argument("--checkpoints", default=CHECKPOINT_PATH)
+    parser.add_argument("--once", action="store_true", help="stop when all files are caught up")
+    parser.add_argument("--flush-rows", type=int, default=50_000, help="write to the store after this many rows")
+    parser.add_argument("--flush-seconds", type=float, default=60.0, help="... or after this many seconds")
+    parser.add_argument("--compact-seconds", type=float, default=3600.0,
+                        help="compact the partitions written to this often")
+    args = parser.parse_args()
+
+    try:
+        follow(args.paths, args.text_field, args.batch_size, args.interval,
+               args.once, args.output, args.checkpoints,
+               args.flush_rows, args.flush_seconds, args.compact_seconds)
+    except KeyboardInterrupt:
+        print(f"\n{INFO}👋 Stopped – offsets are checkpointed.{END}")
@@ -1,6 +1,7 @@
 import streamlit as st
 import time
 import math
+import re
 
 # ============================================================
 # 1️⃣ LOAD CUSTOM CSS
@@ -28,6 +29,16 @@ def load_custom_css():
         animation: fadeIn 0.4s ease-in-out;
     }
 
+    /* Typing reveal — runs entirely in the browser, one message per result */
+    .ai-typing .typed {
+        display: inline-block;
+        animation: typeReveal 0.6s steps(30, end) both;
+    }
+    @keyframes typeReveal {
+        from { clip-path: inset(0 100% 0 0); }
+        to { clip-path: inset(0 0 0 0); }
+    }
+
     /* Gauge Chart */
     .gauge-wrap {
         text-align: center;
@@ -71,23 +82,23 @@ def load_custom_css():
 # 2️⃣ SKELETON LOADING (Facebook effect)
 # ============================================================
 def loading_skeleton(lines=3):
-    with st.container():
-        for _ in range(lines):
-            st.markdown("<div class='skeleton'></div>", unsafe_allow_html=True)
-            time.sleep(0.12)
+    """Draw the skeleton in ONE message (pulse is CSS) and return its placeholder.
+
+    Call `.empty()` on the result once the real content is ready.
+    """
+    placeholder = st.empty()
+    placeholder.markdown("<div class='skeleton'></div>" * lines, unsafe_allow_html=True)
+    return placeholder
 
 
 # ============================================================
-# 3️⃣ AI TYPING EFFECT — type chữ từng ký tự
+# 3️⃣ AI TYPING EFFECT — hiệu ứng gõ chữ bằng CSS phía trình duyệt
 # ============================================================
 def ai_typing(text):
-    container = st.empty()
-    displayed = ""
-
-    for char in text:
-        displayed += char
-        container.markdown(f"<div class='ai-typing'>{displayed}</div>", unsafe_allow_html=True)
-        time.sleep(0.01)
+    # Single websocket message regardless of text length; the reveal
+    # animation is done client-side by .ai-typing .typed
+    html = re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", text)
+    st.markdown(f"<div class='ai-typing'><span class='typed'>{html}</span></div>", unsafe_allow_html=True)
 
 
 # ============================================================
@@ -133,16 +144,104 @@ def colored_tag(sentiment):
         return "<div class='tag neu'>😐 NEUTRAL</div>"
 
 
+# ============================================================
+# 🧠 MODEL CACHE — nạp model một lần cho mỗi tiến trình
+# ============================================================
+@st.cache_resource
+def cached_english_model():
+    from models import load_english_model
+    return load_english_model()
+
+
+# ============================================================
+# ⏱️ SERVER TIME-TO-RESULT — thời gian phía server, từ lúc bấm nút đến khi
+#    script chạy xong (chưa tính mạng và thời gian trình duyệt vẽ kết quả)
+# ============================================================
+def show_server_time_to_result(start, page):
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if "server_time_to_result" not in st.session_state:
+        st.session_state.server_time_to_result = {}
+    st.session_state.server_time_to_result.setdefault(page, []).append(elapsed_ms)
+
+    runs = st.session_state.server_time_to_result[page]
+    st.caption(
+        f"⏱️ Server time to result: {elapsed_ms:.0f} ms "
+        f"(avg {sum(runs) / len(runs):.0f} ms over {len(runs)} runs, excludes network + browser render)"
+    )
+    return elapsed_ms
+
+
 # ============================================================
 # 6️⃣ SAVE HISTORY INTO SESSION STATE
 # ============================================================
-def save_history(text, sentiment, confidence):
+def save_history(text, sentiment, confidence, language=None):
 
     if "history" not in st.session_state:
         st.session_state.history = []
 
-    st.session_state.history.append({
+    entry = {
         "review": text,
         "sentiment": sentiment,
         "confidence": round(confidence, 3)
-    })
+    }
+    if language:
+        entry["language"] = language
+
+    st.session_state.history.append(entry)
+
+
+# ============================================================
+# 7️⃣ KEYWORD SEARCH PANEL — inverted index trên file dataset
+# ============================================================
+@st.cache_resource(max_entries=8, show_spinner=False)
+def cached_keyword_index(path, text_col, label_col, state):
+    # file state (size, inode, mtime, fingerprint) in the key → a rebuilt index is mapped again
+    from models.keyword_index import KeywordIndex
+    return KeywordIndex.load(path, text_col, label_col)
+
+
+def keyword_search_panel(path, text_col, label_col=None, key="kw"):
+    import pandas as pd
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+    from models.keyword_index import KeywordIndex
+
+    path = str(path)
+    handle = KeywordIndex(path, text_col, label_col)
+    state = handle.file_state()
+    status = handle.status(state)
+
+    if status != "current":
+        label = "🗂️ Build keyword index" if status == "missing" else "🔄 Update keyword index"
+        st.caption("Index is missing." if status == "missing" else "File changed since the index was built.")
+        if not st.button(label, key=f"{key}_build"):
+            return
+        with st.spinner("Indexing..."):
+            added = handle.refresh()
+        st.success(f"Indexed {added:,} new rows.")
+
+    index = cached_keyword_index(path, text_col, label_col, state)
+    st.caption(f"🗂️ Indexed {index.rows:,} rows • {index.n_terms:,} terms")
+
+    query = st.text_input('Search terms (use "quotes" for phrases):', key=f"{key}_query")
+    mode = st.radio("Match:", ["any", "all"], horizontal=True, key=f"{key}_mode")
+
+    if query.strip():
+        t0 = time.perf_counter()
+        rows = index.search(query, mode=mode)
+        elapsed = time.perf_counter() - t0
+
+        st.write(f"**{len(rows):,}** matching reviews ({elapsed * 1000:.1f} ms)")
+
+        if label_col and rows:
+            st.bar_chart(pd.Series(index.label_counts(rows), name="reviews"))
+
+        st.dataframe(index.fetch_rows(rows), use_container_width=True)
+
+    if label_col:
+        st.markdown("**Top terms per label**")
+        top = index.top_terms(10, stop_words=ENGLISH_STOP_WORDS)
+        cols = st.columns(max(len(top), 1))
+        for col, (label, terms) in zip(cols, top.items()):
+            col.markdown(f"*{label}*")
+            col.dataframe(pd.DataFrame(terms, columns=["term", "count"]), hide_index=True)